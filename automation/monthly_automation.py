@@ -347,14 +347,12 @@ class MonthlyTLDRAutomationSQLite:
             audio_dir = Path(self.config.get('audio_output_dir', './audio_summaries'))
             audio_path = audio_dir / audio_filename
             
-            try:
-                self.tts.engine.save_to_file(synthesis_with_date, str(audio_path))
-                self.tts.engine.runAndWait()
+            if self.tts.generate_audio_file(synthesis_with_date, audio_path).result():
                 results['audio_file'] = str(audio_path)
                 logger.info(f"🎵 Audio généré: {audio_filename}")
-            except Exception as e:
-                logger.error(f"❌ Erreur génération audio: {e}")
-                results['errors'].append(f"Erreur audio: {str(e)}")
+            else:
+                logger.error("❌ Erreur génération audio")
+                results['errors'].append("Erreur audio: voir les logs")
             
             # 4. STOCKAGE COMPLET DANS SQLITE (remplace SQLite)
             logger.info("💾 Sauvegarde complète dans SQLite...")
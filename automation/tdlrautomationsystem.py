@@ -53,13 +53,14 @@ class TLDRAutomationSystem:
             synthesis = self.ai_processor.synthesize_articles(categorized_articles)
             results['synthesis'] = synthesis
             
+            # Niveau 4: Génération audio, lancée en arrière-plan pendant le stockage
+            audio_future = self.tts.generate_audio_summary(synthesis, categorized_articles)
+            
             # Niveau 2: Stockage Notion
             page_ids = self.notion.bulk_add_articles(categorized_articles)
             results['articles_stored'] = len(page_ids)
             
-            # Niveau 4: Génération audio
-            audio_file = self.tts.generate_audio_summary(synthesis, categorized_articles)
-            results['audio_file'] = audio_file
+            results['audio_file'] = audio_future.result()
             
             logger.info("Daily automation completed successfully")
             
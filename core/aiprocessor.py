@@ -1,18 +1,64 @@
 import requests
 import ollama
+import threading
 from typing import List, Dict, Any
 import logging
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Préchargement des modèles: une seule fois par processus et par modèle
+_WARMUP_LOCK = threading.Lock()
+_WARMED_MODELS = set()
+
+# Templates de prompts (modifiables sans toucher au code des méthodes)
+CATEGORIZE_PROMPT = """Catégorise cet article tech en 2-3 mots max:
+
+Titre: {title}
+Résumé: {summary}
+
+Catégories: AI/IA, Tech, Data, Security, Mobile, Web3, Product, Dev, Design, Business
+
+Réponse (juste les catégories):"""
+
+BATCH_CATEGORIZE_PROMPT = """Catégorise ces {count} articles tech.
+
+{articles_text}
+
+Catégories: AI/IA, Tech, Data, Security, Mobile, Web3, Product, Dev, Design, Business
+
+Format réponse exacte:
+#1: Tech, AI/IA
+#2: Product, Design
+...
+
+Réponse:"""
+
+SYNTHESIS_PROMPT = """Résumé exécutif tech du jour ({count} articles):
+
+{articles_text}
+
+Crée un résumé en 3 parties courtes:
+
+🔍 TENDANCES (2-3 points):
+📊 INSIGHTS (1 paragraphe):  
+💡 ACTIONS (2 recommandations):
+
+Max 200 mots total."""
+
+SHORT_SYNTHESIS_PROMPT = """Résumé tech ({count} articles):
+{articles_text}
+
+3 tendances + 2 actions en 100 mots max."""
+
 class AIProcessor:
     """Niveau 3 - Résumé par IA: Traitement avec LLM local Ollama (SÉCURISÉ)"""
     
-    def __init__(self, model: str = 'nous-hermes2:latest', base_url: str = 'http://localhost:11434', max_articles_per_batch=15):
+    def __init__(self, model: str = 'nous-hermes2:latest', base_url: str = 'http://localhost:11434', max_articles_per_batch=15, keep_alive: str = '30m'):
         self.model = model
         self.base_url = base_url
         self.max_articles_per_batch = max_articles_per_batch  
+        self.keep_alive = keep_alive  # Durée de maintien du modèle en mémoire côté Ollama
         self._verify_ollama_connection()
         
         logger.info(f"AI Processor initialized with Ollama using model {self.model}")
@@ -31,12 +77,31 @@ class AIProcessor:
                     logger.info("To install the model, run: ollama pull nous-hermes2:latest")
                 else:
                     logger.info(f"✅ Ollama connected successfully with {self.model}")
+                    self._warmup_model()
             else:
                 logger.error("❌ Cannot connect to Ollama. Make sure it's running: ollama serve")
         except Exception as e:
             logger.error(f"❌ Ollama connection error: {e}")
             logger.info("Install Ollama: https://ollama.ai/ and run: ollama serve")
     
+    def _warmup_model(self):
+        """Précharge le modèle en mémoire pour que la première requête ne paie pas le chargement"""
+        with _WARMUP_LOCK:
+            if self.model in _WARMED_MODELS:
+                return
+            
+            try:
+                ollama.generate(
+                    model=self.model,
+                    prompt='ok',
+                    options={'num_predict': 1},
+                    keep_alive=self.keep_alive
+                )
+                _WARMED_MODELS.add(self.model)
+                logger.info(f"🔥 Modèle {self.model} préchargé (keep_alive={self.keep_alive})")
+            except Exception as e:
+                logger.warning(f"⚠️ Préchargement du modèle impossible: {e}")
+    
     def _query_ollama(self, prompt: str, max_tokens: int = 500) -> str:
         """Envoie une requête à Ollama avec protection"""
         try:
@@ -59,7 +124,8 @@ class AIProcessor:
                     'num_predict': max_tokens,
                     'temperature': 0.3,
                     'top_p': 0.9,
-                }
+                },
+                keep_alive=self.keep_alive
             )
             
             result = response['message']['content']
@@ -94,14 +160,10 @@ class AIProcessor:
             try:
                 logger.info(f"Catégorisation article {i}/{len(articles)}")
 
-                prompt = f"""Catégorise cet article tech en 2-3 mots max:
-
-Titre: {article['titre'][:100]}
-Résumé: {article.get('resume_tldr', '')[:200]}
-
-Catégories: AI/IA, Tech, Data, Security, Mobile, Web3, Product, Dev, Design, Business
-
-Réponse (juste les catégories):"""
+                prompt = CATEGORIZE_PROMPT.format(
+                    title=article['titre'][:100],
+                    summary=article.get('resume_tldr', '')[:200]
+                )
                 
                 result = self._query_ollama(prompt, max_tokens=30)
                 categories = [cat.strip() for cat in result.split(',') if cat.strip()]
@@ -147,18 +209,7 @@ Réponse (juste les catégories):"""
             
             articles_text = "\n".join(articles_list)
 
-            prompt = f"""Catégorise ces {len(articles)} articles tech.
-
-{articles_text}
-
-Catégories: AI/IA, Tech, Data, Security, Mobile, Web3, Product, Dev, Design, Business
-
-Format réponse exacte:
-#1: Tech, AI/IA
-#2: Product, Design
-...
-
-Réponse:"""
+            prompt = BATCH_CATEGORIZE_PROMPT.format(count=len(articles), articles_text=articles_text)
 
             if len(prompt) > 6000:
                 # Réduire le nombre d'articles
@@ -220,17 +271,7 @@ Réponse:"""
             
             articles_text = "\n".join(articles_summary)
 
-            prompt = f"""Résumé exécutif tech du jour ({len(articles)} articles):
-
-{articles_text}
-
-Crée un résumé en 3 parties courtes:
-
-🔍 TENDANCES (2-3 points):
-📊 INSIGHTS (1 paragraphe):  
-💡 ACTIONS (2 recommandations):
-
-Max 200 mots total."""
+            prompt = SYNTHESIS_PROMPT.format(count=len(articles), articles_text=articles_text)
 
             if len(prompt) > 4000:
                 # Réduction drastique si trop long
@@ -238,10 +279,10 @@ Max 200 mots total."""
                 for article in articles[:5]:
                     articles_mini.append(f"• {article['titre'][:40]}")
                 
-                prompt = f"""Résumé tech ({len(articles)} articles):
-{chr(10).join(articles_mini)}
-
-3 tendances + 2 actions en 100 mots max."""
+                prompt = SHORT_SYNTHESIS_PROMPT.format(
+                    count=len(articles),
+                    articles_text="\n".join(articles_mini)
+                )
             
             logger.info(f"Synthèse de {len(articles)} articles (prompt: {len(prompt)} chars)")
             synthesis = self._query_ollama(prompt, max_tokens=300)
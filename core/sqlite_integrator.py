@@ -1,28 +1,254 @@
 import sqlite3
 import logging
 import json
-from typing import List, Dict, Any, Optional
+import gzip
+import operator
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import chain, islice
+from typing import List, Dict, Any, Optional, Final
 from datetime import datetime
 from pathlib import Path
-import time
 
-logging.basicConfig(level=logging.INFO)
+from utils.schemaversions import mark_schema_current, schema_is_current
+
+try:
+    import orjson
+except ImportError:  # Repli sur le module json standard
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:  # Contenu brut stocké en texte, non compressé
+    zstandard = None
+
 logger = logging.getLogger(__name__)
 
+# Sérialisation JSON des colonnes (catégories, erreurs, métadonnées).
+# orjson renvoie des bytes: on décode pour que SQLite stocke du TEXT et non un BLOB
+if orjson is not None:
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode('utf-8')
+    
+    def _dumpb(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    _loads = orjson.loads
+else:
+    _dumps = json.dumps
+    
+    def _dumpb(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+    _loads = json.loads
+
+# Compression zstd du contenu brut: BLOB compressé au-delà du seuil, TEXT sinon.
+# La lecture distingue les deux formats par le type de la valeur (bytes / str)
+_COMPRESS_MIN_SIZE: Final[int] = 256
+if zstandard is not None:
+    _ZSTD_C = zstandard.ZstdCompressor(level=3)
+    _ZSTD_D = zstandard.ZstdDecompressor()
+
+
+def _pack_contenu(text: str) -> Any:
+    """Compresse le contenu brut avant insertion (si zstandard est disponible)"""
+    if zstandard is None or not text:
+        return text
+    data = text.encode('utf-8')
+    if len(data) < _COMPRESS_MIN_SIZE:
+        return text
+    return sqlite3.Binary(_ZSTD_C.compress(data))
+
+
+@lru_cache(maxsize=None)
+def _log_missing_zstandard():
+    """Signale une seule fois qu'un contenu compressé ne peut pas être relu"""
+    logger.error("❌ Contenu brut compressé (zstd) illisible: installez zstandard")
+
+
+def _unpack_contenu(value: Any) -> Any:
+    """Décompresse le contenu brut lu en base (None si le BLOB ne peut pas être relu)"""
+    if isinstance(value, bytes):
+        if zstandard is None:
+            _log_missing_zstandard()
+            return None
+        return _ZSTD_D.decompress(value).decode('utf-8')
+    return value
+
+# Colonnes d'un article (ordre de _INSERT_ARTICLE_SQL) et valeurs par défaut.
+# Fusion avec les défauts puis itemgetter: une seule extraction en C par article
+_ARTICLE_KEYS: Final[tuple] = (
+    'titre', 'url', 'resume_tldr', 'etat', 'categories_ia', 'duree_lecture',
+    'date_extraction', 'source', 'newsletter_type', 'contenu_brut'
+)
+_ARTICLE_DEFAULTS: Final[Dict[str, Any]] = {
+    'titre': '', 'url': '', 'resume_tldr': '', 'etat': 'Nouveau', 'categories_ia': (),
+    'duree_lecture': '', 'date_extraction': None, 'source': '', 'newsletter_type': '',
+    'contenu_brut': ''
+}
+_get_article_fields = operator.itemgetter(*_ARTICLE_KEYS)
+
+
+def _article_params(article: Dict[str, Any], today: str) -> tuple:
+    """Paramètres d'insertion d'un article (`today` si la date est absente)"""
+    (titre, url, resume_tldr, etat, categories_ia, duree_lecture,
+     date_extraction, source, newsletter_type, contenu_brut) = _get_article_fields(
+        {**_ARTICLE_DEFAULTS, **article})
+    return (titre, url, resume_tldr, etat, _dumps(categories_ia), duree_lecture,
+            date_extraction or today, source, newsletter_type, _pack_contenu(contenu_brut))
+
+# Requêtes d'insertion: même objet str à chaque appel pour réutiliser
+# les statements déjà préparés par le cache de la connexion.
+# Une URL déjà présente est ignorée par SQLite (aucune ligne renvoyée par RETURNING);
+# ON CONFLICT plutôt que OR IGNORE pour que les autres contraintes (NOT NULL) échouent toujours
+_INSERT_ARTICLE_SQL: Final[str] = (
+    "INSERT INTO articles (titre, url, resume_tldr, etat, categories_ia, duree_lecture, "
+    "date_extraction, source, newsletter_type, contenu_brut) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?) ON CONFLICT DO NOTHING RETURNING id"
+)
+
+# Insertion en lot par blocs de VALUES multi-lignes: 50 lignes x 10 colonnes = 500
+# paramètres, sous la limite historique de 999 variables par requête
+_ARTICLE_ROW_PLACEHOLDERS: Final[str] = "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+_ARTICLES_PER_INSERT: Final[int] = 500 // len(_ARTICLE_KEYS)
+
+
+@lru_cache(maxsize=None)
+def _sql_insert_articles(row_count: int) -> str:
+    """INSERT multi-lignes pour `row_count` articles (même objet str à chaque appel)"""
+    head, tail = _INSERT_ARTICLE_SQL.split(_ARTICLE_ROW_PLACEHOLDERS)
+    return head + ", ".join([_ARTICLE_ROW_PLACEHOLDERS] * row_count) + tail
+
+_INSERT_SYNTH_SQL: Final[str] = (
+    "INSERT INTO syntheses (date_synthese, newsletter_type, contenu, nb_articles, temps_traitement) "
+    "VALUES (?, ?, ?, ?, ?)"
+)
+_INSERT_REPORT_SQL: Final[str] = (
+    "INSERT INTO rapports (date_rapport, newsletter_type, articles_extraits, articles_stockes, "
+    "succes, erreurs, temps_traitement, fichier_audio, metadonnees) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+# Statistiques de get_statistics: (section, clé, valeur, complément) pour chaque ligne.
+# Compteurs lus dans la table meta (maintenue par triggers), pas de COUNT(*) complet
+_STATISTICS_SQL: Final[str] = """
+    WITH by_type AS (
+        SELECT newsletter_type, COUNT(*) AS c
+        FROM articles
+        GROUP BY newsletter_type
+    ), recent AS (
+        SELECT date_extraction, COUNT(*) AS c
+        FROM articles
+        WHERE date_extraction >= date('now', '-7 days')
+        GROUP BY date_extraction
+        ORDER BY date_extraction DESC
+    ), last_syntheses AS (
+        SELECT date_synthese, newsletter_type, nb_articles
+        FROM syntheses
+        ORDER BY created_at DESC
+        LIMIT 5
+    )
+    SELECT 'count', k, v, NULL FROM meta
+    UNION ALL SELECT 'type', newsletter_type, c, NULL FROM by_type
+    UNION ALL SELECT 'recent', date_extraction, c, NULL FROM recent
+    UNION ALL SELECT 'synthesis', date_synthese, nb_articles, newsletter_type FROM last_syntheses
+"""
+
+# Partie du schéma versionnée par ce module (cf. utils/schemaversions.py)
+_SCHEMA_COMPONENT: Final[str] = 'sqlite_integrator'
+
+# Index plein texte externe (contenu lu dans la table articles)
+_FTS_TABLE_SQL: Final[str] = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5("
+    "titre, resume_tldr, content='articles', content_rowid='id')"
+)
+
+# Lignes du dump (iterdump) propres à l'index FTS5, reconnues par leur début uniquement:
+# table virtuelle (CREATE ou écriture directe dans sqlite_master) et tables internes
+# articles_fts_*. Les INSERT de articles ne sont jamais concernés, quel que soit leur contenu
+_FTS_DUMP_PREFIXES: Final[tuple] = (
+    "CREATE VIRTUAL TABLE articles_fts",
+    "INSERT INTO sqlite_master(type,name,tbl_name,rootpage,sql)VALUES('table','articles_fts',",
+    'INSERT INTO "articles_fts',
+    "CREATE TABLE 'articles_fts_",
+)
+
+# Tables dont le nombre de lignes est tenu à jour dans la table meta
+_COUNTED_TABLES: Final[tuple] = ('articles', 'syntheses', 'rapports')
+
+# Réglages appliqués à chaque connexion: WAL (persistant sur le fichier),
+# fsync allégé et cache/mmap plus généreux
+_CONNECTION_PRAGMAS = """
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-64000;
+    PRAGMA mmap_size=268435456;
+"""
+
+# Mode mono-écrivain: verrou de fichier conservé pour toute la session
+# (plus d'acquisition/libération à chaque transaction) et checkpoints WAL espacés
+_SINGLE_WRITER_PRAGMAS = """
+    PRAGMA locking_mode=EXCLUSIVE;
+    PRAGMA wal_autocheckpoint=10000;
+"""
+
 class SQLiteIntegrator:
     """Remplacement de Notion par SQLite - Plus simple et plus fiable"""
     
-    def __init__(self, db_path: str = "data/tldr_database.db"):
+    def __init__(self, db_path: str = "data/tldr_database.db", single_writer: bool = False):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # Verrou exclusif: à réserver aux processus seuls à accéder à la base
+        # (bloque le dashboard et les connexions des autres threads)
+        self.single_writer = single_writer
+        self._local = threading.local()  # Une connexion persistante par thread
         
         # Créer la base de données et les tables
         self._init_database()
-        logger.info(f"✅ SQLite Database initialisée: {self.db_path}")
+        logger.info("✅ SQLite Database initialisée: %s", self.db_path)
+    
+    def _conn(self) -> sqlite3.Connection:
+        """Retourne la connexion du thread courant (créée une seule fois, en autocommit)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, isolation_level=None,
+                                   check_same_thread=False, cached_statements=128)
+            if self.single_writer:
+                conn.executescript(_SINGLE_WRITER_PRAGMAS)
+            conn.executescript(_CONNECTION_PRAGMAS)
+            self._local.conn = conn
+        return conn
+    
+    @contextmanager
+    def _transaction(self, conn: Optional[sqlite3.Connection] = None):
+        """Ouvre une transaction sur la connexion du thread, sauf si l'appelant en fournit déjà une"""
+        if conn is not None:
+            yield conn
+            return
+        
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+    
+    def close(self):
+        """Ferme la connexion du thread courant"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
     
     def _init_database(self):
-        """Initialise la base de données avec les tables nécessaires"""
-        with sqlite3.connect(self.db_path) as conn:
+        """Initialise la base de données avec les tables nécessaires (une seule fois par version de schéma)"""
+        conn = self._conn()
+        if schema_is_current(conn, _SCHEMA_COMPONENT):
+            return
+        
+        with self._transaction() as conn:
             cursor = conn.cursor()
             
             # Table principale pour les articles
@@ -79,137 +305,175 @@ class SQLiteIntegrator:
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_articles_type ON articles(newsletter_type)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_syntheses_date ON syntheses(date_synthese)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_rapports_date ON rapports(date_rapport)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_articles_created ON articles(created_at DESC)')
+            
+            # Unicité des URLs (les articles sans URL restent autorisés en plusieurs exemplaires)
+            schema_complete = True
+            try:
+                cursor.execute('''
+                    CREATE UNIQUE INDEX IF NOT EXISTS idx_articles_url_unique ON articles(url)
+                    WHERE url IS NOT NULL AND url != ''
+                ''')
+            except sqlite3.IntegrityError:
+                # Doublons déjà présents: on ne supprime rien, l'index sera retenté au prochain démarrage
+                schema_complete = False
+                logger.warning("⚠️ Doublons d'URL existants, index d'unicité non créé")
             
-            conn.commit()
+            # Index plein texte (FTS5) sur titre/résumé, synchronisé par triggers
+            fts_exists = cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'articles_fts'"
+            ).fetchone()
+            cursor.execute(_FTS_TABLE_SQL)
+            cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS articles_fts_ai AFTER INSERT ON articles BEGIN
+                    INSERT INTO articles_fts(rowid, titre, resume_tldr)
+                    VALUES (new.id, new.titre, new.resume_tldr);
+                END
+            ''')
+            cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS articles_fts_ad AFTER DELETE ON articles BEGIN
+                    INSERT INTO articles_fts(articles_fts, rowid, titre, resume_tldr)
+                    VALUES ('delete', old.id, old.titre, old.resume_tldr);
+                END
+            ''')
+            cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS articles_fts_au AFTER UPDATE ON articles BEGIN
+                    INSERT INTO articles_fts(articles_fts, rowid, titre, resume_tldr)
+                    VALUES ('delete', old.id, old.titre, old.resume_tldr);
+                    INSERT INTO articles_fts(rowid, titre, resume_tldr)
+                    VALUES (new.id, new.titre, new.resume_tldr);
+                END
+            ''')
+            if not fts_exists:
+                # Base existante: indexer les articles déjà présents
+                cursor.execute("INSERT INTO articles_fts(articles_fts) VALUES ('rebuild')")
+            
+            # Compteurs de lignes maintenus par triggers (évite les COUNT(*) complets)
+            meta_exists = cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'meta'"
+            ).fetchone()
+            cursor.execute('CREATE TABLE IF NOT EXISTS meta (k TEXT PRIMARY KEY, v INTEGER NOT NULL DEFAULT 0)')
+            for table in _COUNTED_TABLES:
+                cursor.execute(f'''
+                    CREATE TRIGGER IF NOT EXISTS {table}_count_ai AFTER INSERT ON {table} BEGIN
+                        UPDATE meta SET v = v + 1 WHERE k = '{table}';
+                    END
+                ''')
+                cursor.execute(f'''
+                    CREATE TRIGGER IF NOT EXISTS {table}_count_ad AFTER DELETE ON {table} BEGIN
+                        UPDATE meta SET v = v - 1 WHERE k = '{table}';
+                    END
+                ''')
+                if not meta_exists:
+                    # Initialisation unique à partir du contenu existant
+                    cursor.execute(
+                        f"INSERT OR IGNORE INTO meta (k, v) VALUES ('{table}', (SELECT COUNT(*) FROM {table}))"
+                    )
+            
+            # Version enregistrée dans la même transaction: seulement si tout le DDL a réussi
+            if schema_complete:
+                mark_schema_current(conn, _SCHEMA_COMPONENT)
             logger.info("📋 Tables SQLite créées/vérifiées")
     
+    @staticmethod
+    def _row_counts(conn: sqlite3.Connection) -> Dict[str, int]:
+        """Nombre de lignes par table, lu dans la table meta (O(1))"""
+        counts = dict.fromkeys(_COUNTED_TABLES, 0)
+        counts.update(conn.execute("SELECT k, v FROM meta").fetchall())
+        return counts
+    
     def test_connection(self) -> bool:
         """Test la connexion à la base SQLite"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("SELECT COUNT(*) FROM articles")
-                count = cursor.fetchone()[0]
-                
-                cursor.execute("SELECT COUNT(*) FROM syntheses")
-                syntheses_count = cursor.fetchone()[0]
+            with self._conn() as conn:
+                counts = self._row_counts(conn)
                 
-                cursor.execute("SELECT COUNT(*) FROM rapports")
-                rapports_count = cursor.fetchone()[0]
-                
-                logger.info(f"✅ Base SQLite connectée !")
-                logger.info(f"📊 Statistiques:")
-                logger.info(f"   • Articles: {count}")
-                logger.info(f"   • Synthèses: {syntheses_count}")
-                logger.info(f"   • Rapports: {rapports_count}")
+                logger.info("✅ Base SQLite connectée !")
+                logger.info("📊 Statistiques:")
+                logger.info("   • Articles: %s", counts['articles'])
+                logger.info("   • Synthèses: %s", counts['syntheses'])
+                logger.info("   • Rapports: %s", counts['rapports'])
                 
                 return True
                 
         except Exception as e:
-            logger.error(f"❌ Erreur connexion SQLite: {e}")
+            logger.error("❌ Erreur connexion SQLite: %s", e)
             return False
     
     def add_article_to_db(self, article: Dict[str, Any]) -> Optional[int]:
         """Ajoute un article à la base SQLite"""
         try:
             # Préparer les données
-            categories_json = json.dumps(article.get('categories_ia', []))
+            params = _article_params(article, datetime.now().strftime('%Y-%m-%d'))
             
-            with sqlite3.connect(self.db_path) as conn:
+            with self._conn() as conn:
                 cursor = conn.cursor()
                 
-                cursor.execute('''
-                    INSERT INTO articles (
-                        titre, url, resume_tldr, etat, categories_ia,
-                        duree_lecture, date_extraction, source, newsletter_type, contenu_brut
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    article.get('titre', ''),
-                    article.get('url', ''),
-                    article.get('resume_tldr', ''),
-                    article.get('etat', 'Nouveau'),
-                    categories_json,
-                    article.get('duree_lecture', ''),
-                    article.get('date_extraction', datetime.now().strftime('%Y-%m-%d')),
-                    article.get('source', ''),
-                    article.get('newsletter_type', ''),
-                    article.get('contenu_brut', '')
-                ))
+                cursor.execute(_INSERT_ARTICLE_SQL, params)
                 
-                article_id = cursor.lastrowid
-                conn.commit()
+                row = cursor.fetchone()
+                if row is None:
+                    logger.debug("⏭️ Article déjà présent (URL): %.50s", article.get('titre', 'Sans titre'))
+                    return None
                 
-                logger.debug(f"✅ Article ajouté (ID: {article_id}): {article.get('titre', 'Sans titre')[:50]}")
+                article_id = row[0]
+                logger.debug("✅ Article ajouté (ID: %s): %.50s", article_id, article.get('titre', 'Sans titre'))
                 return article_id
                 
         except Exception as e:
-            logger.error(f"❌ Erreur ajout article: {e}")
+            logger.error("❌ Erreur ajout article: %s", e)
             return None
     
-    def bulk_add_articles(self, articles: List[Dict[str, Any]]) -> List[int]:
-        """Ajoute plusieurs articles en lot"""
+    def bulk_add_articles(self, articles: List[Dict[str, Any]],
+                          conn: Optional[sqlite3.Connection] = None) -> List[int]:
+        """Ajoute plusieurs articles en lot (dans la transaction de `conn` si fournie)"""
         article_ids = []
         
         if not articles:
             logger.warning("📦 Aucun article à ajouter")
             return article_ids
         
-        logger.info(f"📦 Ajout en lot de {len(articles)} articles à SQLite...")
+        logger.info("📦 Ajout en lot de %s articles à SQLite...", len(articles))
         
-        # Préparer toutes les données
-        articles_data = []
-        for article in articles:
-            categories_json = json.dumps(article.get('categories_ia', []))
-            articles_data.append((
-                article.get('titre', ''),
-                article.get('url', ''),
-                article.get('resume_tldr', ''),
-                article.get('etat', 'Nouveau'),
-                categories_json,
-                article.get('duree_lecture', ''),
-                article.get('date_extraction', datetime.now().strftime('%Y-%m-%d')),
-                article.get('source', ''),
-                article.get('newsletter_type', ''),
-                article.get('contenu_brut', '')
-            ))
+        # Paramètres générés à la volée (pas de liste intermédiaire);
+        # date par défaut calculée une seule fois, uniquement utilisée si la clé manque
+        today = datetime.now().strftime('%Y-%m-%d')
+        articles_data = (_article_params(article, today) for article in articles)
         
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
-                # Insertion en lot
-                cursor.executemany('''
-                    INSERT INTO articles (
-                        titre, url, resume_tldr, etat, categories_ia,
-                        duree_lecture, date_extraction, source, newsletter_type, contenu_brut
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', articles_data)
-                
-                # Récupérer les IDs générés
-                first_id = cursor.lastrowid - len(articles) + 1
-                article_ids = list(range(first_id, cursor.lastrowid + 1))
-                
-                conn.commit()
-                
-                logger.info(f"✅ {len(article_ids)} articles ajoutés avec succès à SQLite")
-                return article_ids
+            with self._transaction(conn) as tx:
+                cursor = tx.cursor()
+                
+                # Un INSERT par bloc de lignes, dans une seule transaction; RETURNING donne
+                # les IDs exacts des lignes créées (une URL déjà en base ne renvoie rien).
+                # L'ordre de RETURNING n'étant pas garanti, les IDs sont triés (ordre d'insertion)
+                while True:
+                    chunk = list(islice(articles_data, _ARTICLES_PER_INSERT))
+                    if not chunk:
+                        break
+                    cursor.execute(_sql_insert_articles(len(chunk)), list(chain.from_iterable(chunk)))
+                    article_ids.extend(sorted(row[0] for row in cursor))
+                
+            logger.info("✅ %s articles ajoutés avec succès à SQLite", len(article_ids))
+            if len(article_ids) < len(articles):
+                logger.info("⏭️ %s doublons ignorés", len(articles) - len(article_ids))
+            return article_ids
                 
         except Exception as e:
-            logger.error(f"❌ Erreur ajout en lot: {e}")
+            if conn is not None:
+                raise  # La transaction englobante doit être annulée
+            logger.error("❌ Erreur ajout en lot: %s", e)
             return []
     
-    def add_synthesis_to_db(self, synthesis_data: Dict[str, Any]) -> Optional[int]:
-        """Ajoute une synthèse quotidienne à la base"""
+    def add_synthesis_to_db(self, synthesis_data: Dict[str, Any],
+                            conn: Optional[sqlite3.Connection] = None) -> Optional[int]:
+        """Ajoute une synthèse quotidienne à la base (dans la transaction de `conn` si fournie)"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
+            with self._transaction(conn) as tx:
+                cursor = tx.cursor()
                 
-                cursor.execute('''
-                    INSERT INTO syntheses (
-                        date_synthese, newsletter_type, contenu, nb_articles, temps_traitement
-                    ) VALUES (?, ?, ?, ?, ?)
-                ''', (
-                    synthesis_data.get('date_formatted', datetime.now().strftime('%Y-%m-%d')),
+                cursor.execute(_INSERT_SYNTH_SQL, (
+                    synthesis_data.get('date_formatted') or datetime.now().strftime('%Y-%m-%d'),
                     synthesis_data.get('newsletter_type', 'tech'),
                     synthesis_data.get('synthesis', ''),
                     synthesis_data.get('articles_extracted', 0),
@@ -217,35 +481,42 @@ class SQLiteIntegrator:
                 ))
                 
                 synthesis_id = cursor.lastrowid
-                conn.commit()
                 
-                logger.info(f"✅ Synthèse ajoutée (ID: {synthesis_id})")
-                return synthesis_id
+            logger.info("✅ Synthèse ajoutée (ID: %s)", synthesis_id)
+            return synthesis_id
                 
         except Exception as e:
-            logger.error(f"❌ Erreur ajout synthèse: {e}")
+            if conn is not None:
+                raise
+            logger.error("❌ Erreur ajout synthèse: %s", e)
             return None
     
-    def add_daily_report_to_db(self, daily_results: Dict[str, Any]) -> Optional[int]:
-        """Ajoute un rapport quotidien à la base"""
+    @staticmethod
+    def _report_metadata_json(daily_results: Dict[str, Any]) -> str:
+        """Métadonnées JSON d'un rapport quotidien"""
+        return _dumps({
+            'day_name': daily_results.get('day_name', ''),
+            'audio_file': daily_results.get('audio_file', ''),
+            'synthesis_preview': daily_results.get('synthesis', '')[:200]
+        })
+    
+    def add_daily_report_to_db(self, daily_results: Dict[str, Any],
+                               conn: Optional[sqlite3.Connection] = None,
+                               metadonnees_json: Optional[str] = None) -> Optional[int]:
+        """Ajoute un rapport quotidien à la base (dans la transaction de `conn` si fournie)
+        
+        `metadonnees_json` permet de fournir des métadonnées déjà sérialisées.
+        """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
+            with self._transaction(conn) as tx:
+                cursor = tx.cursor()
                 
-                erreurs_json = json.dumps(daily_results.get('errors', []))
-                metadonnees_json = json.dumps({
-                    'day_name': daily_results.get('day_name', ''),
-                    'audio_file': daily_results.get('audio_file', ''),
-                    'synthesis_preview': daily_results.get('synthesis', '')[:200]
-                })
+                erreurs_json = _dumps(daily_results.get('errors', []))
+                if metadonnees_json is None:
+                    metadonnees_json = self._report_metadata_json(daily_results)
                 
-                cursor.execute('''
-                    INSERT INTO rapports (
-                        date_rapport, newsletter_type, articles_extraits, articles_stockes,
-                        succes, erreurs, temps_traitement, fichier_audio, metadonnees
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    daily_results.get('date_formatted', datetime.now().strftime('%Y-%m-%d')),
+                cursor.execute(_INSERT_REPORT_SQL, (
+                    daily_results.get('date_formatted') or datetime.now().strftime('%Y-%m-%d'),
                     daily_results.get('newsletter_type', 'tech'),
                     daily_results.get('articles_extracted', 0),
                     daily_results.get('articles_stored', 0),
@@ -257,17 +528,18 @@ class SQLiteIntegrator:
                 ))
                 
                 report_id = cursor.lastrowid
-                conn.commit()
                 
-                logger.info(f"✅ Rapport ajouté (ID: {report_id})")
-                return report_id
+            logger.info("✅ Rapport ajouté (ID: %s)", report_id)
+            return report_id
                 
         except Exception as e:
-            logger.error(f"❌ Erreur ajout rapport: {e}")
+            if conn is not None:
+                raise
+            logger.error("❌ Erreur ajout rapport: %s", e)
             return None
     
     def save_complete_daily_results(self, daily_results: Dict[str, Any]) -> Dict[str, Any]:
-        """Sauvegarde complète des résultats quotidiens dans SQLite"""
+        """Sauvegarde complète des résultats quotidiens dans SQLite (une seule transaction)"""
         
         saved_ids = {
             'articles': [],
@@ -275,89 +547,75 @@ class SQLiteIntegrator:
             'report_id': None
         }
         
+        # Métadonnées du rapport sérialisées une seule fois, hors transaction
+        metadonnees_json = self._report_metadata_json(daily_results)
+        
         try:
-            # 1. Ajouter tous les articles individuels
-            if daily_results.get('articles'):
-                logger.info("💾 Sauvegarde des articles individuels...")
-                article_ids = self.bulk_add_articles(daily_results['articles'])
-                saved_ids['articles'] = article_ids
-                
-                # Mettre à jour le nombre d'articles stockés
-                daily_results['articles_stored'] = len(article_ids)
-                logger.info(f"✅ {len(article_ids)} articles sauvegardés dans SQLite")
-            
-            # 2. Ajouter la synthèse
-            if daily_results.get('synthesis'):
-                logger.info("💾 Sauvegarde de la synthèse...")
-                synthesis_id = self.add_synthesis_to_db(daily_results)
-                if synthesis_id:
-                    saved_ids['synthesis_id'] = synthesis_id
-                    logger.info("✅ Synthèse sauvegardée dans SQLite")
-            
-            # 3. Ajouter le rapport quotidien
-            logger.info("💾 Sauvegarde du rapport quotidien...")
-            report_id = self.add_daily_report_to_db(daily_results)
-            if report_id:
-                saved_ids['report_id'] = report_id
-                logger.info("✅ Rapport sauvegardé dans SQLite")
+            with self._transaction() as conn:
+                # 1. Ajouter tous les articles individuels
+                if daily_results.get('articles'):
+                    logger.info("💾 Sauvegarde des articles individuels...")
+                    article_ids = self.bulk_add_articles(daily_results['articles'], conn=conn)
+                    saved_ids['articles'] = article_ids
+                    
+                    # Mettre à jour le nombre d'articles stockés
+                    daily_results['articles_stored'] = len(article_ids)
+                    logger.info("✅ %s articles sauvegardés dans SQLite", len(article_ids))
+                
+                # 2. Ajouter la synthèse
+                if daily_results.get('synthesis'):
+                    logger.info("💾 Sauvegarde de la synthèse...")
+                    synthesis_id = self.add_synthesis_to_db(daily_results, conn=conn)
+                    if synthesis_id:
+                        saved_ids['synthesis_id'] = synthesis_id
+                        logger.info("✅ Synthèse sauvegardée dans SQLite")
+                
+                # 3. Ajouter le rapport quotidien
+                logger.info("💾 Sauvegarde du rapport quotidien...")
+                report_id = self.add_daily_report_to_db(daily_results, conn=conn,
+                                                        metadonnees_json=metadonnees_json)
+                if report_id:
+                    saved_ids['report_id'] = report_id
+                    logger.info("✅ Rapport sauvegardé dans SQLite")
             
             # Résumé final
             total_elements = len(saved_ids['articles']) + (1 if saved_ids['synthesis_id'] else 0) + (1 if saved_ids['report_id'] else 0)
-            logger.info(f"✅ Sauvegarde SQLite terminée: {total_elements} éléments créés")
+            logger.info("✅ Sauvegarde SQLite terminée: %s éléments créés", total_elements)
             
             return saved_ids
             
         except Exception as e:
-            logger.error(f"❌ Erreur lors de la sauvegarde complète: {e}")
-            return saved_ids
+            # La transaction a été annulée: aucun élément n'a été conservé
+            logger.error("❌ Erreur lors de la sauvegarde complète: %s", e)
+            return {'articles': [], 'synthesis_id': None, 'report_id': None}
     
     def get_statistics(self) -> Dict[str, Any]:
         """Récupère les statistiques de la base"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._conn() as conn:
                 cursor = conn.cursor()
                 
-                # Statistiques générales
-                cursor.execute("SELECT COUNT(*) FROM articles")
-                total_articles = cursor.fetchone()[0]
-                
-                cursor.execute("SELECT COUNT(*) FROM syntheses")
-                total_syntheses = cursor.fetchone()[0]
-                
-                cursor.execute("SELECT COUNT(*) FROM rapports")
-                total_rapports = cursor.fetchone()[0]
-                
-                # Articles par newsletter
-                cursor.execute('''
-                    SELECT newsletter_type, COUNT(*) 
-                    FROM articles 
-                    GROUP BY newsletter_type
-                ''')
-                articles_by_type = dict(cursor.fetchall())
-                
-                # Articles par date (derniers 7 jours)
-                cursor.execute('''
-                    SELECT date_extraction, COUNT(*) 
-                    FROM articles 
-                    WHERE date_extraction >= date('now', '-7 days')
-                    GROUP BY date_extraction 
-                    ORDER BY date_extraction DESC
-                ''')
-                recent_articles = dict(cursor.fetchall())
-                
-                # Dernières synthèses
-                cursor.execute('''
-                    SELECT date_synthese, newsletter_type, nb_articles 
-                    FROM syntheses 
-                    ORDER BY created_at DESC 
-                    LIMIT 5
-                ''')
-                recent_syntheses = cursor.fetchall()
+                # Toutes les statistiques en un seul aller-retour, démultiplexées par section
+                cursor.execute(_STATISTICS_SQL)
+                
+                counts = dict.fromkeys(_COUNTED_TABLES, 0)
+                articles_by_type = {}
+                recent_articles = {}
+                recent_syntheses = []
+                for section, key, value, extra in cursor.fetchall():
+                    if section == 'count':
+                        counts[key] = value
+                    elif section == 'type':
+                        articles_by_type[key] = value
+                    elif section == 'recent':
+                        recent_articles[key] = value
+                    else:
+                        recent_syntheses.append((key, extra, value))
                 
                 return {
-                    'total_articles': total_articles,
-                    'total_syntheses': total_syntheses,
-                    'total_rapports': total_rapports,
+                    'total_articles': counts['articles'],
+                    'total_syntheses': counts['syntheses'],
+                    'total_rapports': counts['rapports'],
                     'articles_by_type': articles_by_type,
                     'recent_articles': recent_articles,
                     'recent_syntheses': recent_syntheses,
@@ -366,77 +624,120 @@ class SQLiteIntegrator:
                 }
                 
         except Exception as e:
-            logger.error(f"❌ Erreur récupération statistiques: {e}")
+            logger.error("❌ Erreur récupération statistiques: %s", e)
             return {}
     
     def export_to_json(self, output_file: str = None) -> str:
-        """Exporte toute la base en JSON"""
+        """Exporte toute la base en JSON, ligne par ligne (sans charger les tables en mémoire)
+        
+        Pour une sauvegarde, préférer export_to_sql_gz.
+        """
         if not output_file:
             output_file = f"tldr_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
         
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row  # Pour avoir des dictionnaires
-                cursor = conn.cursor()
-                
-                # Récupérer toutes les données
-                cursor.execute("SELECT * FROM articles ORDER BY created_at")
-                articles = [dict(row) for row in cursor.fetchall()]
-                
-                cursor.execute("SELECT * FROM syntheses ORDER BY created_at")
-                syntheses = [dict(row) for row in cursor.fetchall()]
-                
-                cursor.execute("SELECT * FROM rapports ORDER BY created_at")
-                rapports = [dict(row) for row in cursor.fetchall()]
-                
-                # Préparer l'export
-                export_data = {
-                    'export_date': datetime.now().isoformat(),
-                    'statistics': self.get_statistics(),
-                    'articles': articles,
-                    'syntheses': syntheses,
-                    'rapports': rapports
-                }
-                
-                # Sauvegarder
-                export_path = Path(output_file)
-                with open(export_path, 'w', encoding='utf-8') as f:
-                    json.dump(export_data, f, indent=2, ensure_ascii=False)
+            export_path = Path(output_file)
+            with self._conn() as conn, open(export_path, 'wb') as f:
+                f.write(b'{"export_date": ' + _dumpb(datetime.now().isoformat()))
+                f.write(b',\n"statistics": ' + _dumpb(self.get_statistics()))
+                
+                # Chaque table est écrite au fil du curseur
+                for table in ('articles', 'syntheses', 'rapports'):
+                    cursor = conn.cursor()
+                    cursor.arraysize = 1000
+                    cursor.execute(f"SELECT * FROM {table} ORDER BY created_at")
+                    cols = [d[0] for d in cursor.description]
+                    
+                    f.write(b',\n"' + table.encode('ascii') + b'": [')
+                    separator = b'\n'
+                    for row in cursor:
+                        record = dict(zip(cols, row))
+                        if 'contenu_brut' in record:
+                            record['contenu_brut'] = _unpack_contenu(record['contenu_brut'])
+                        f.write(separator + _dumpb(record))
+                        separator = b',\n'
+                    f.write(b'\n]')
+                
+                f.write(b'}\n')
+            
+            logger.info("✅ Export JSON créé: %s", export_path)
+            return str(export_path)
                 
-                logger.info(f"✅ Export JSON créé: {export_path}")
-                return str(export_path)
+        except Exception as e:
+            logger.error("❌ Erreur export JSON: %s", e)
+            return ""
+    
+    def export_to_sql_gz(self, output_file: str = None) -> str:
+        """Sauvegarde complète de la base en dump SQL compressé (gzip)
+        
+        Plus rapide et plus fidèle que export_to_json: à privilégier pour les sauvegardes.
+        Restauration: `gunzip -c fichier.sql.gz | sqlite3 nouvelle_base.db`
+        """
+        if not output_file:
+            output_file = f"tldr_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.sql.gz"
+        
+        try:
+            export_path = Path(output_file)
+            conn = self._conn()
+            with gzip.open(export_path, 'wb', compresslevel=3) as f:
+                for line in conn.iterdump():
+                    # L'index FTS5 (table virtuelle + tables internes) n'est pas
+                    # restaurable tel quel: il est recréé puis reconstruit en fin de dump
+                    if line.startswith(_FTS_DUMP_PREFIXES):
+                        continue
+                    if line.startswith('PRAGMA writable_schema'):
+                        continue
+                    if line == 'COMMIT;':
+                        f.write(f"{_FTS_TABLE_SQL};\n".encode('utf-8'))
+                        f.write(b"INSERT INTO articles_fts(articles_fts) VALUES ('rebuild');\n")
+                    f.write(line.encode('utf-8'))
+                    f.write(b'\n')
+            
+            logger.info("✅ Dump SQL créé: %s", export_path)
+            return str(export_path)
                 
         except Exception as e:
-            logger.error(f"❌ Erreur export JSON: {e}")
+            logger.error("❌ Erreur dump SQL: %s", e)
             return ""
     
+    @staticmethod
+    def _fts_query(query: str) -> str:
+        """Transforme une saisie libre en requête FTS5 (termes cités, recherche par préfixe)"""
+        return ' '.join('"' + term.replace('"', '""') + '"*' for term in query.split())
+    
     def search_articles(self, query: str, limit: int = 20) -> List[Dict]:
-        """Recherche dans les articles"""
+        """Recherche plein texte dans les titres et résumés (index FTS5)"""
+        fts_query = self._fts_query(query)
+        if not fts_query:
+            return []
+        
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
+            with self._conn() as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute('''
-                    SELECT * FROM articles 
-                    WHERE titre LIKE ? OR resume_tldr LIKE ? 
-                    ORDER BY created_at DESC 
+                    SELECT a.* FROM articles_fts f
+                    JOIN articles a ON a.id = f.rowid
+                    WHERE articles_fts MATCH ?
+                    ORDER BY f.rank
                     LIMIT ?
-                ''', (f'%{query}%', f'%{query}%', limit))
+                ''', (fts_query, limit))
                 
-                results = [dict(row) for row in cursor.fetchall()]
+                cols = [d[0] for d in cursor.description]
+                results = [dict(zip(cols, row)) for row in cursor.fetchall()]
                 
-                # Parser les catégories JSON
+                # Parser les catégories JSON et décompresser le contenu brut
                 for result in results:
                     try:
-                        result['categories_ia'] = json.loads(result['categories_ia'])
+                        result['categories_ia'] = _loads(result['categories_ia'])
                     except:
                         result['categories_ia'] = []
+                    result['contenu_brut'] = _unpack_contenu(result['contenu_brut'])
                 
                 return results
                 
         except Exception as e:
-            logger.error(f"❌ Erreur recherche: {e}")
+            logger.error("❌ Erreur recherche: %s", e)
             return []
 
 # Fonction de remplacement pour l'automatisation
@@ -451,9 +752,10 @@ def create_sqlite_integrator(config: Dict[str, Any]) -> SQLiteIntegrator:
         SQLiteIntegrator: Instance configurée
     """
     db_path = config.get('sqlite_db_path', 'data/tldr_database.db')
-    return SQLiteIntegrator(db_path)
+    return SQLiteIntegrator(db_path, single_writer=config.get('sqlite_single_writer', False))
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     logger.info("🚀 Test du SQLiteIntegrator")
     
     # Créer l'intégrator
@@ -484,7 +786,7 @@ if __name__ == "__main__":
         ]
 
         article_ids = db.bulk_add_articles(test_articles)
-        logger.info(f"Articles ajoutés: {article_ids}")
+        logger.info("Articles ajoutés: %s", article_ids)
 
         synthesis_data = {
             'date_formatted': '2025-06-30',
@@ -494,7 +796,7 @@ if __name__ == "__main__":
             'processing_time': 1.5
         }
         synthesis_id = db.add_synthesis_to_db(synthesis_data)
-        logger.info(f"Synthèse ajoutée: {synthesis_id}")
+        logger.info("Synthèse ajoutée: %s", synthesis_id)
 
         daily_results = {
             'date_formatted': '2025-06-30',
@@ -507,21 +809,21 @@ if __name__ == "__main__":
             'audio_file': 'test.wav'
         }
         report_id = db.add_daily_report_to_db(daily_results)
-        logger.info(f"Rapport ajouté: {report_id}")
+        logger.info("Rapport ajouté: %s", report_id)
         
         # Statistiques
         stats = db.get_statistics()
-        logger.info(f"📊 Statistiques:")
+        logger.info("📊 Statistiques:")
         for key, value in stats.items():
-            logger.info(f"   {key}: {value}")
+            logger.info("   %s: %s", key, value)
         
         # Recherche
         results = db.search_articles("SQLite")
-        logger.info(f"🔍 Résultats recherche 'SQLite': {len(results)} articles")
+        logger.info("🔍 Résultats recherche 'SQLite': %s articles", len(results))
         
         # Export
         export_file = db.export_to_json("test_export.json")
-        logger.info(f"📤 Export créé: {export_file}")
+        logger.info("📤 Export créé: %s", export_file)
         
         logger.info("🎉 Tous les tests SQLite réussis!")
     else:
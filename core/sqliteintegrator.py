@@ -1,136 +1,550 @@
 import sqlite3
 import logging
 import json
-from typing import List, Dict, Any, Optional
+import queue
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import chain, islice
+from typing import List, Dict, Any, Optional, Callable
 from datetime import datetime
 from pathlib import Path
 import time
 
+from utils.schemaversions import mark_schema_sql, schema_is_current
+
+try:
+    import orjson
+except ImportError:  # Repli sur le module json standard
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:  # Contenu brut stocké en texte, non compressé
+    zstandard = None
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Format des nouvelles bases, à fixer avant la création du fichier (et avant le passage
+# en WAL): pages de 16 Ko pour les articles volumineux, fichier réduit par incremental_vacuum
+_NEW_DATABASE_PRAGMAS = """
+    PRAGMA page_size=16384;
+    PRAGMA auto_vacuum=INCREMENTAL;
+"""
+
+# Sérialisation JSON des colonnes (catégories, erreurs).
+# orjson renvoie des bytes: on décode pour que SQLite stocke du TEXT et non un BLOB
+if orjson is not None:
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode('utf-8')
+else:
+    _dumps = json.dumps
+
+# Listes et dictionnaires passés en paramètre sont convertis en JSON par sqlite3
+# lui-même (adaptateur recherché par type), sans appel explicite ligne par ligne
+sqlite3.register_adapter(list, _dumps)
+sqlite3.register_adapter(dict, _dumps)
+
+# Compression zstd du contenu brut: BLOB compressé au-delà du seuil, TEXT sinon
+# (même format que core/sqlite_integrator.py, qui sait relire les deux)
+_COMPRESS_MIN_SIZE = 256
+if zstandard is not None:
+    _ZSTD_C = zstandard.ZstdCompressor(level=3)
+
+
+def _pack_contenu(text: str) -> Any:
+    """Compresse le contenu brut avant insertion (si zstandard est disponible)"""
+    if zstandard is None or not text:
+        return text
+    data = text.encode('utf-8')
+    if len(data) < _COMPRESS_MIN_SIZE:
+        return text
+    return sqlite3.Binary(_ZSTD_C.compress(data))
+
+# Réglages de la connexion: WAL (persistant sur le fichier), fsync allégé,
+# cache/mmap plus généreux et attente du verrou plutôt qu'un échec immédiat
+_CONNECTION_PRAGMAS = """
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-64000;
+    PRAGMA mmap_size=268435456;
+    PRAGMA busy_timeout=5000;
+    PRAGMA wal_autocheckpoint=1000;
+"""
+
+# Index secondaires des articles: supprimés pendant les gros imports puis recréés
+# en une passe, plutôt que maintenus ligne par ligne. L'index d'unicité sur l'URL
+# n'en fait pas partie: il sert à la déduplication pendant l'insertion
+_DEFERRABLE_INDEXES = {
+    'idx_articles_date_type': 'CREATE INDEX IF NOT EXISTS idx_articles_date_type ON articles(date_extraction, newsletter_type)',
+    'idx_articles_type': 'CREATE INDEX IF NOT EXISTS idx_articles_type ON articles(newsletter_type)',
+    'idx_articles_source': 'CREATE INDEX IF NOT EXISTS idx_articles_source ON articles(source)',
+    # Index partiel: seuls les articles pas encore traités y figurent
+    'idx_articles_etat': "CREATE INDEX IF NOT EXISTS idx_articles_etat ON articles(etat) WHERE etat = 'Nouveau'",
+    # Filtre par newsletter + tri par date du dashboard: parcours d'intervalle sur le B-tree, sans tri
+    'idx_articles_nl_date': 'CREATE INDEX IF NOT EXISTS idx_articles_nl_date ON articles(newsletter_type, date_extraction DESC)',
+    # Lectures du viewer: articles d'un jour déjà triés, exports/recherche LIKE dans l'ordre de création
+    'idx_articles_date_created': 'CREATE INDEX IF NOT EXISTS idx_articles_date_created ON articles(date_extraction, created_at)',
+    'idx_articles_created': 'CREATE INDEX IF NOT EXISTS idx_articles_created ON articles(created_at)',
+}
+# Reconstruire un index coûte O(taille de la table): on ne diffère que les lots d'au moins
+# 500 articles et au moins aussi gros que la table existante
+_DEFER_INDEXES_MIN_ROWS = 500
+
+# Une ligne par catégorie: filtrable en SQL (WHERE category = ?) sans décoder le JSON.
+# Alimentée par triggers depuis categories_ia, quel que soit le script qui écrit les articles
+# (même schéma que celui de sqlite_viewer.py)
+_CATEGORIES_DDL = """
+    CREATE TABLE IF NOT EXISTS article_categories (
+        article_id INTEGER NOT NULL REFERENCES articles(id),
+        category TEXT NOT NULL,
+        PRIMARY KEY (article_id, category)
+    );
+    CREATE INDEX IF NOT EXISTS idx_article_categories_category ON article_categories(category);
+    CREATE TRIGGER IF NOT EXISTS article_categories_ai AFTER INSERT ON articles
+    WHEN json_valid(new.categories_ia) AND json_type(new.categories_ia) = 'array'
+    BEGIN
+        INSERT OR IGNORE INTO article_categories (article_id, category)
+        SELECT new.id, value FROM json_each(new.categories_ia) WHERE type = 'text';
+    END;
+    CREATE TRIGGER IF NOT EXISTS article_categories_ad AFTER DELETE ON articles BEGIN
+        DELETE FROM article_categories WHERE article_id = old.id;
+    END;
+    CREATE TRIGGER IF NOT EXISTS article_categories_au AFTER UPDATE OF categories_ia ON articles BEGIN
+        DELETE FROM article_categories WHERE article_id = old.id;
+        INSERT OR IGNORE INTO article_categories (article_id, category)
+        SELECT new.id, value FROM json_each(new.categories_ia)
+        WHERE json_valid(new.categories_ia) AND json_type(new.categories_ia) = 'array' AND type = 'text';
+    END;
+"""
+
+# Remplissage unique depuis les articles déjà en base; la version (utils/schemaversions.py,
+# partagée avec sqlite_viewer.py) n'est enregistrée que dans la même transaction
+_CATEGORIES_BACKFILL_SQL = f"""
+    BEGIN;
+    INSERT OR IGNORE INTO article_categories (article_id, category)
+    SELECT a.id, j.value FROM articles a, json_each(a.categories_ia) j
+    WHERE json_valid(a.categories_ia) AND json_type(a.categories_ia) = 'array' AND j.type = 'text';
+    {mark_schema_sql('article_categories')}
+    COMMIT;
+"""
+
+# Écritures en arrière-plan (synthèses et rapports): regroupées par transaction,
+# validées toutes les 100 ms ou tous les 100 éléments
+_WRITER_FLUSH_INTERVAL = 0.1
+_WRITER_BATCH_SIZE = 100
+
+# Écritures relancées si la base reste verrouillée: 10, 20, 40, 80 ms
+_BUSY_RETRY_ATTEMPTS = 5
+_BUSY_RETRY_BASE_DELAY = 0.01
+
+# Requêtes d'insertion: le même objet str est passé à chaque appel, ce qui permet
+# au cache de la connexion de réutiliser le statement déjà préparé
+_SQL_INSERT_ARTICLE_HEAD = """
+    INSERT INTO articles (
+        titre, url, resume_tldr, etat, categories_ia,
+        duree_lecture, date_extraction, source, newsletter_type, contenu_brut
+    ) VALUES """
+_ARTICLE_ROW_PLACEHOLDERS = "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+
+# Articles insérés par blocs de VALUES multi-lignes: 50 lignes x 10 colonnes = 500
+# paramètres, sous la limite historique de 999 variables par requête
+_ARTICLE_COLUMNS = 10
+_ARTICLES_PER_INSERT = 500 // _ARTICLE_COLUMNS
+
+
+@lru_cache(maxsize=None)
+def _sql_insert_articles(row_count: int) -> str:
+    """INSERT multi-lignes pour `row_count` articles (même objet str à chaque appel)"""
+    placeholders = ", ".join([_ARTICLE_ROW_PLACEHOLDERS] * row_count)
+    return f"{_SQL_INSERT_ARTICLE_HEAD}{placeholders} ON CONFLICT DO NOTHING RETURNING id"
+
+_SQL_INSERT_SYNTHESIS = """
+    INSERT INTO syntheses (date_synthese, newsletter_type, contenu, nb_articles, temps_traitement)
+    VALUES (?, ?, ?, ?, ?)
+"""
+_SQL_INSERT_REPORT = """
+    INSERT INTO rapports (
+        date_rapport, newsletter_type, articles_extraits, articles_stockes,
+        succes, erreurs, temps_traitement, fichier_audio
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_SQL_INSERT_REPORT_ATTACHED = _SQL_INSERT_REPORT.replace("INTO rapports", "INTO rep.rapports")
+
+_RAPPORTS_DDL = """
+    CREATE TABLE IF NOT EXISTS {schema}.rapports (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        date_rapport TEXT NOT NULL,
+        newsletter_type TEXT NOT NULL,
+        articles_extraits INTEGER DEFAULT 0,
+        articles_stockes INTEGER DEFAULT 0,
+        succes BOOLEAN DEFAULT 0,
+        erreurs TEXT,
+        temps_traitement REAL DEFAULT 0,
+        fichier_audio TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+"""
+
+# Base de rapports attachée (télémétrie): perdre le dernier rapport en cas de crash
+# est acceptable, ses écritures se passent donc de fsync et de journal sur disque
+_REPORTS_PRAGMAS = """
+    PRAGMA rep.journal_mode=MEMORY;
+    PRAGMA rep.synchronous=OFF;
+"""
+
+# Schéma principal en un seul script (une passe d'analyse au lieu d'un execute par instruction):
+# tables, index secondaires, index des dates filtrées par le dashboard et catégories normalisées.
+# idx_articles_date_type sert aussi les filtres sur date_extraction seule (préfixe de l'index)
+_SCHEMA_DDL = f"""
+    CREATE TABLE IF NOT EXISTS articles (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        titre TEXT NOT NULL,
+        url TEXT,
+        resume_tldr TEXT,
+        etat TEXT DEFAULT 'Nouveau',
+        categories_ia TEXT,
+        duree_lecture TEXT,
+        date_extraction TEXT,
+        source TEXT,
+        newsletter_type TEXT,
+        contenu_brut TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+    CREATE TABLE IF NOT EXISTS syntheses (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        date_synthese TEXT NOT NULL,
+        newsletter_type TEXT NOT NULL,
+        contenu TEXT NOT NULL,
+        nb_articles INTEGER DEFAULT 0,
+        temps_traitement REAL DEFAULT 0,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+    {_RAPPORTS_DDL.format(schema='main')};
+    {';'.join(_DEFERRABLE_INDEXES.values())};
+    CREATE INDEX IF NOT EXISTS idx_syntheses_date ON syntheses(date_synthese);
+    CREATE INDEX IF NOT EXISTS idx_syntheses_date_created ON syntheses(date_synthese, created_at DESC);
+    CREATE INDEX IF NOT EXISTS idx_syntheses_nl_date ON syntheses(newsletter_type, date_synthese);
+    CREATE INDEX IF NOT EXISTS idx_rapports_date ON rapports(date_rapport);
+    CREATE INDEX IF NOT EXISTS idx_rapports_nl_date ON rapports(newsletter_type, date_rapport);
+{_CATEGORIES_DDL}"""
+
 class SQLiteIntegrator:
     """Remplacement de Notion par SQLite - Plus simple et plus fiable"""
     
-    def __init__(self, db_path: str = "data/tldr_database.db"):
+    def __init__(self, db_path: str = "data/tldr_database.db", background_writes: bool = False,
+                 reports_db_path: Optional[str] = None):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        # Connexion unique réutilisée par toutes les méthodes (partagée entre threads sous verrou),
+        # en autocommit: les transactions d'écriture sont ouvertes explicitement
+        is_new_database = not self.db_path.exists() or self.db_path.stat().st_size == 0
+        self._conn = sqlite3.connect(self.db_path, isolation_level=None,
+                                     check_same_thread=False, cached_statements=256)
+        if is_new_database:
+            self._conn.executescript(_NEW_DATABASE_PRAGMAS)
+        self._conn.executescript(_CONNECTION_PRAGMAS)
+        # Accès aux colonnes par nom pour les lecteurs (dashboard), sans surcoût pour row[0]
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.RLock()
+        
+        # Rapports optionnellement écrits dans une base séparée, non durable (ex: data/tldr_reports.db).
+        # Sans elle, les rapports restent dans la base principale lue par le dashboard
+        self.reports_db_path = Path(reports_db_path) if reports_db_path else None
+        self._sql_insert_report = _SQL_INSERT_REPORT
+        if self.reports_db_path:
+            self.reports_db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn.execute("ATTACH DATABASE ? AS rep", (str(self.reports_db_path),))
+            self._conn.executescript(_REPORTS_PRAGMAS)
+            self._sql_insert_report = _SQL_INSERT_REPORT_ATTACHED
+        
         self._init_database()
+        
+        # Synthèses et rapports écrits par un thread dédié: pas d'attente du COMMIT côté appelant
+        self._queue = None
+        self._writer_thread = None
+        if background_writes:
+            self._queue = queue.Queue()
+            self._writer_thread = threading.Thread(target=self._drain, name="sqlite-writer", daemon=True)
+            self._writer_thread.start()
+        
         logger.info(f"✅ SQLite Database initialisée: {self.db_path}")
     
+    def _drain(self):
+        """Boucle du thread d'écriture: regroupe les lignes reçues et les insère par lots"""
+        running = True
+        while running:
+            item = self._queue.get()
+            batch = [item]
+            deadline = time.monotonic() + _WRITER_FLUSH_INTERVAL
+            while len(batch) < _WRITER_BATCH_SIZE:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=timeout))
+                except queue.Empty:
+                    break
+            
+            # Regroupement par table: un executemany par requête, une seule transaction
+            rows_by_sql = {}
+            for entry in batch:
+                if entry is None:  # Signal d'arrêt envoyé par close()
+                    running = False
+                    continue
+                sql, row = entry
+                rows_by_sql.setdefault(sql, []).append(row)
+            
+            def write():
+                with self._transaction() as conn:
+                    for sql, rows in rows_by_sql.items():
+                        conn.executemany(sql, rows)
+            
+            try:
+                if rows_by_sql:
+                    self._retry(write)
+            except Exception as e:
+                logger.error(f"❌ Erreur écriture en arrière-plan ({len(batch)} éléments perdus): {e}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+    
+    def flush(self):
+        """Attend que toutes les écritures en arrière-plan soient validées"""
+        if self._queue is not None:
+            self._queue.join()
+    
+    def close(self):
+        """Ferme la connexion SQLite (après avoir vidé la file d'écriture)"""
+        writer = getattr(self, '_writer_thread', None)
+        if writer is not None:
+            self._queue.put(None)
+            writer.join(timeout=5)
+            self._writer_thread = None
+        
+        conn = getattr(self, '_conn', None)
+        if conn is not None:
+            with self._lock:
+                conn.close()
+                self._conn = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+    
+    def __del__(self):
+        self.close()
+    
     def _init_database(self):
         """Initialise la base de données avec les tables nécessaires"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._lock, self._conn as conn:
             cursor = conn.cursor()
             
-            # Table principale pour les articles
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS articles (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    titre TEXT NOT NULL,
-                    url TEXT,
-                    resume_tldr TEXT,
-                    etat TEXT DEFAULT 'Nouveau',
-                    categories_ia TEXT,
-                    duree_lecture TEXT,
-                    date_extraction TEXT,
-                    source TEXT,
-                    newsletter_type TEXT,
-                    contenu_brut TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
+            # Catégories déjà migrées? (à vérifier avant que le script ne crée la table)
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'article_categories'")
+            categories_ready = cursor.fetchone() is not None and schema_is_current(conn, 'article_categories')
             
-            # Table pour les synthèses quotidiennes
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS syntheses (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    date_synthese TEXT NOT NULL,
-                    newsletter_type TEXT NOT NULL,
-                    contenu TEXT NOT NULL,
-                    nb_articles INTEGER DEFAULT 0,
-                    temps_traitement REAL DEFAULT 0,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
+            # Tables, index et triggers en un seul script
+            cursor.executescript(_SCHEMA_DDL)
             
-            # Table pour les rapports quotidiens
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS rapports (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    date_rapport TEXT NOT NULL,
-                    newsletter_type TEXT NOT NULL,
-                    articles_extraits INTEGER DEFAULT 0,
-                    articles_stockes INTEGER DEFAULT 0,
-                    succes BOOLEAN DEFAULT 0,
-                    erreurs TEXT,
-                    temps_traitement REAL DEFAULT 0,
-                    fichier_audio TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
+            # Copie de la table des rapports dans la base de rapports attachée
+            if self.reports_db_path:
+                cursor.execute(_RAPPORTS_DDL.format(schema='rep'))
+                cursor.execute('CREATE INDEX IF NOT EXISTS rep.idx_rapports_date ON rapports(date_rapport)')
             
-            conn.commit()
+            # Unicité des URLs (les articles sans URL restent autorisés en plusieurs exemplaires)
+            try:
+                cursor.execute('''
+                    CREATE UNIQUE INDEX IF NOT EXISTS idx_articles_url ON articles(url)
+                    WHERE url IS NOT NULL AND url != ''
+                ''')
+            except sqlite3.IntegrityError:
+                logger.warning("⚠️ Doublons d'URL existants, index d'unicité non créé")
+            
+            # Les triggers ne couvrent que les nouveaux articles: remplissage unique de l'existant
+            if not categories_ready:
+                cursor.executescript(_CATEGORIES_BACKFILL_SQL)
+    
+    def maintenance(self) -> bool:
+        """Maintenance périodique (à appeler par le planificateur, ex. chaque nuit):
+        libère les pages vides, ramène le fichier WAL à zéro et met à jour
+        les statistiques du planificateur SQL"""
+        try:
+            with self._lock:
+                # Sans effet sur les bases créées avant auto_vacuum=INCREMENTAL
+                self._conn.execute("PRAGMA incremental_vacuum").fetchall()
+
+                busy = self._conn.execute(
+                    "PRAGMA wal_checkpoint(TRUNCATE)"
+                ).fetchone()[0]
+                self._conn.execute("PRAGMA optimize")
+            
+            if busy:
+                logger.warning("⚠️ Checkpoint WAL incomplet (lecteurs actifs)")
+            else:
+                logger.info("🧹 Maintenance SQLite terminée (WAL tronqué, statistiques à jour)")
+            return not busy
+            
+        except Exception as e:
+            logger.error(f"❌ Erreur maintenance SQLite: {e}")
+            return False
     
     def test_connection(self) -> bool:
         """Test la connexion à la base SQLite"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("SELECT COUNT(*) FROM articles")
-                count = cursor.fetchone()[0]
-                logger.info(f"✅ Base SQLite connectée ! ({count} articles)")
+            with self._lock, self._conn as conn:
+                # MAX(rowid) lit un seul nœud du B-tree, COUNT(*) parcourrait toute la table
+                last_id = conn.execute("SELECT COALESCE(MAX(rowid), 0) FROM articles").fetchone()[0]
+                logger.info(f"✅ Base SQLite connectée ! (dernier article #{last_id})")
                 return True
         except Exception as e:
             logger.error(f"❌ Erreur connexion SQLite: {e}")
             return False
     
-    def bulk_add_articles(self, articles: List[Dict[str, Any]]) -> List[int]:
-        """Ajoute plusieurs articles en lot"""
+    def _retry(self, write: Callable[[], Any]) -> Any:
+        """Exécute une écriture transactionnelle, relancée si la base est verrouillée
+        par un autre processus (au-delà du busy_timeout), avec attente exponentielle"""
+        for attempt in range(_BUSY_RETRY_ATTEMPTS):
+            try:
+                return write()
+            except sqlite3.OperationalError as e:
+                message = str(e)
+                transient = 'locked' in message or 'busy' in message
+                if not transient or attempt == _BUSY_RETRY_ATTEMPTS - 1:
+                    raise
+                delay = _BUSY_RETRY_BASE_DELAY * 2 ** attempt
+                logger.warning(f"⚠️ Base verrouillée, nouvelle tentative dans {delay * 1000:.0f} ms")
+                time.sleep(delay)
+    
+    @contextmanager
+    def _transaction(self):
+        """Transaction explicite sur la connexion partagée: un seul COMMIT (un seul fsync)"""
+        with self._lock:
+            conn = self._conn
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+    
+    def _insert_articles_nocommit(self, conn: sqlite3.Connection, articles: List[Dict[str, Any]]) -> List[int]:
+        """Insère les articles dans la transaction en cours et renvoie leurs IDs"""
+        # Paramètres générés à la volée (pas de liste intermédiaire);
+        # date du jour calculée une fois: même valeur pour tout le lot
+        today = datetime.now().strftime('%Y-%m-%d')
+        rows = ((
+            article.get('titre', ''),
+            article.get('url', ''),
+            article.get('resume_tldr', ''),
+            article.get('etat', 'Nouveau'),
+            article.get('categories_ia') or [],
+            article.get('duree_lecture', ''),
+            article.get('date_extraction') or today,
+            article.get('source', ''),
+            article.get('newsletter_type', ''),
+            _pack_contenu(article.get('contenu_brut', ''))
+        ) for article in articles)
+        
+        # Un INSERT par bloc de lignes; RETURNING donne les IDs exacts des lignes
+        # créées (une URL déjà en base ne renvoie rien). L'ordre de RETURNING
+        # n'étant pas garanti, les IDs sont triés (ordre d'insertion)
         article_ids = []
+        while True:
+            chunk = list(islice(rows, _ARTICLES_PER_INSERT))
+            if not chunk:
+                break
+            cur = conn.execute(_sql_insert_articles(len(chunk)), list(chain.from_iterable(chunk)))
+            article_ids.extend(sorted(created[0] for created in cur))
+        
+        if len(article_ids) < len(articles):
+            logger.info(f"⏭️ {len(articles) - len(article_ids)} doublons ignorés")
         
+        return article_ids
+    
+    @staticmethod
+    def _synthesis_row(daily_results: Dict[str, Any]) -> tuple:
+        """Paramètres d'insertion de la synthèse"""
+        return (
+            daily_results.get('date_formatted', ''),
+            daily_results.get('newsletter_type', 'tech'),
+            daily_results.get('synthesis', ''),
+            daily_results.get('articles_extracted', 0),
+            daily_results.get('processing_time', 0)
+        )
+    
+    @staticmethod
+    def _report_row(daily_results: Dict[str, Any]) -> tuple:
+        """Paramètres d'insertion du rapport quotidien"""
+        return (
+            daily_results.get('date_formatted', ''),
+            daily_results.get('newsletter_type', 'tech'),
+            daily_results.get('articles_extracted', 0),
+            daily_results.get('articles_stored', 0),
+            daily_results.get('success', False),
+            daily_results.get('errors') or [],
+            daily_results.get('processing_time', 0),
+            daily_results.get('audio_file', '')
+        )
+    
+    def _insert_row(self, sql: str, params: tuple) -> int:
+        """Insère une ligne dans la transaction en cours et renvoie son ID"""
+        return self._conn.execute(sql, params).lastrowid
+    
+    def bulk_add_articles(self, articles: List[Dict[str, Any]], defer_indexes: bool = True) -> List[int]:
+        """Ajoute plusieurs articles en lot
+        
+        Avec `defer_indexes`, les index secondaires sont reconstruits après l'insertion
+        pour les lots d'au moins _DEFER_INDEXES_MIN_ROWS articles et au moins aussi gros
+        que la table existante (sinon la reconstruction coûterait plus que la maintenance).
+        """
         if not articles:
-            return article_ids
+            return []
         
         logger.info(f"📦 Ajout en lot de {len(articles)} articles à SQLite...")
         
-        try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
+        def write() -> List[int]:
+            with self._transaction() as conn:
+                # Taille de la table lue dans la transaction; MAX(rowid) ne lit qu'un nœud
+                # du B-tree (surestimée après des suppressions: on diffère alors moins souvent)
+                defer = False
+                if defer_indexes and len(articles) >= _DEFER_INDEXES_MIN_ROWS:
+                    existing_rows = conn.execute("SELECT COALESCE(MAX(rowid), 0) FROM articles").fetchone()[0]
+                    defer = len(articles) >= existing_rows
                 
-                for article in articles:
-                    categories_json = json.dumps(article.get('categories_ia', []))
-                    
-                    cursor.execute('''
-                        INSERT INTO articles (
-                            titre, url, resume_tldr, etat, categories_ia,
-                            duree_lecture, date_extraction, source, newsletter_type, contenu_brut
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ''', (
-                        article.get('titre', ''),
-                        article.get('url', ''),
-                        article.get('resume_tldr', ''),
-                        article.get('etat', 'Nouveau'),
-                        categories_json,
-                        article.get('duree_lecture', ''),
-                        article.get('date_extraction', datetime.now().strftime('%Y-%m-%d')),
-                        article.get('source', ''),
-                        article.get('newsletter_type', ''),
-                        article.get('contenu_brut', '')
-                    ))
-                    
-                    article_ids.append(cursor.lastrowid)
+                # Dans la transaction: en cas d'échec, les index d'origine sont restaurés
+                if defer:
+                    for index_name in _DEFERRABLE_INDEXES:
+                        conn.execute(f"DROP INDEX IF EXISTS {index_name}")
                 
-                conn.commit()
-                logger.info(f"✅ {len(article_ids)} articles sauvegardés dans SQLite")
-                return article_ids
+                ids = self._insert_articles_nocommit(conn, articles)
+                
+                if defer:
+                    for index_sql in _DEFERRABLE_INDEXES.values():
+                        conn.execute(index_sql)
+            return ids
+        
+        try:
+            article_ids = self._retry(write)
+            logger.info(f"✅ {len(article_ids)} articles sauvegardés dans SQLite")
+            return article_ids
                 
         except Exception as e:
             logger.error(f"❌ Erreur ajout en lot: {e}")
             return []
     
     def save_complete_daily_results(self, daily_results: Dict[str, Any]) -> Dict[str, Any]:
-        """Sauvegarde complète des résultats quotidiens dans SQLite"""
+        """Sauvegarde complète des résultats quotidiens dans SQLite (une seule transaction)
+        
+        Avec `background_writes`, seuls les articles sont écrits immédiatement: la synthèse
+        et le rapport partent dans la file d'écriture et leurs IDs valent None.
+        """
         
         saved_ids = {
             'articles': [],
@@ -138,56 +552,34 @@ class SQLiteIntegrator:
             'report_id': None
         }
         
+        if self._queue is not None:
+            return self._save_daily_results_background(daily_results, saved_ids)
+        
+        def write() -> Dict[str, Any]:
+            ids = dict(saved_ids)
+            with self._transaction() as conn:
+                # 1. Ajouter tous les articles individuels
+                if daily_results.get('articles'):
+                    logger.info("💾 Sauvegarde des articles individuels...")
+                    ids['articles'] = self._insert_articles_nocommit(conn, daily_results['articles'])
+                    daily_results['articles_stored'] = len(ids['articles'])
+                
+                # 2. Ajouter la synthèse
+                if daily_results.get('synthesis'):
+                    logger.info("💾 Sauvegarde de la synthèse...")
+                    ids['synthesis_id'] = self._insert_row(_SQL_INSERT_SYNTHESIS, self._synthesis_row(daily_results))
+                
+                # 3. Ajouter le rapport quotidien
+                logger.info("💾 Sauvegarde du rapport quotidien...")
+                ids['report_id'] = self._insert_row(self._sql_insert_report, self._report_row(daily_results))
+            return ids
+        
         try:
-            # 1. Ajouter tous les articles individuels
-            if daily_results.get('articles'):
-                logger.info("💾 Sauvegarde des articles individuels...")
-                article_ids = self.bulk_add_articles(daily_results['articles'])
-                saved_ids['articles'] = article_ids
-                daily_results['articles_stored'] = len(article_ids)
+            saved_ids = self._retry(write)
             
-            # 2. Ajouter la synthèse
-            if daily_results.get('synthesis'):
-                logger.info("💾 Sauvegarde de la synthèse...")
-                with sqlite3.connect(self.db_path) as conn:
-                    cursor = conn.cursor()
-                    cursor.execute('''
-                        INSERT INTO syntheses (date_synthese, newsletter_type, contenu, nb_articles, temps_traitement)
-                        VALUES (?, ?, ?, ?, ?)
-                    ''', (
-                        daily_results.get('date_formatted', ''),
-                        daily_results.get('newsletter_type', 'tech'),
-                        daily_results.get('synthesis', ''),
-                        daily_results.get('articles_extracted', 0),
-                        daily_results.get('processing_time', 0)
-                    ))
-                    saved_ids['synthesis_id'] = cursor.lastrowid
-                    conn.commit()
+            logger.info(f"✅ {len(saved_ids['articles'])} articles sauvegardés dans SQLite")
+            if saved_ids['synthesis_id']:
                 logger.info("✅ Synthèse sauvegardée dans SQLite")
-            
-            # 3. Ajouter le rapport quotidien
-            logger.info("💾 Sauvegarde du rapport quotidien...")
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                erreurs_json = json.dumps(daily_results.get('errors', []))
-                
-                cursor.execute('''
-                    INSERT INTO rapports (
-                        date_rapport, newsletter_type, articles_extraits, articles_stockes,
-                        succes, erreurs, temps_traitement, fichier_audio
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    daily_results.get('date_formatted', ''),
-                    daily_results.get('newsletter_type', 'tech'),
-                    daily_results.get('articles_extracted', 0),
-                    daily_results.get('articles_stored', 0),
-                    daily_results.get('success', False),
-                    erreurs_json,
-                    daily_results.get('processing_time', 0),
-                    daily_results.get('audio_file', '')
-                ))
-                saved_ids['report_id'] = cursor.lastrowid
-                conn.commit()
             logger.info("✅ Rapport sauvegardé dans SQLite")
             
             # Résumé final
@@ -197,5 +589,21 @@ class SQLiteIntegrator:
             return saved_ids
             
         except Exception as e:
+            # La transaction a été annulée: aucun élément n'a été conservé
             logger.error(f"❌ Erreur lors de la sauvegarde complète: {e}")
-            return saved_ids
+            return {'articles': [], 'synthesis_id': None, 'report_id': None}
+    
+    def _save_daily_results_background(self, daily_results: Dict[str, Any],
+                                       saved_ids: Dict[str, Any]) -> Dict[str, Any]:
+        """Articles écrits immédiatement, synthèse et rapport confiés au thread d'écriture"""
+        if daily_results.get('articles'):
+            logger.info("💾 Sauvegarde des articles individuels...")
+            saved_ids['articles'] = self.bulk_add_articles(daily_results['articles'])
+            daily_results['articles_stored'] = len(saved_ids['articles'])
+        
+        if daily_results.get('synthesis'):
+            self._queue.put((_SQL_INSERT_SYNTHESIS, self._synthesis_row(daily_results)))
+        self._queue.put((self._sql_insert_report, self._report_row(daily_results)))
+        
+        logger.info("⏳ Synthèse et rapport en file d'écriture")
+        return saved_ids
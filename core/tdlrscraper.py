@@ -1,13 +1,188 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
+from lxml import etree
 import re
+import os
+import json
+import time
+import asyncio
+import tempfile
+from bisect import bisect_right
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
 from datetime import datetime, date, timedelta
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple, FrozenSet
 import logging
 
+from utils.charfilter import CharFilter
+
+try:
+    import deepl
+except ImportError:  # traduction désactivée
+    deepl = None
+
+try:
+    import aiohttp
+except ImportError:  # repli sur des requêtes séquentielles via requests
+    aiohttp = None
+
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:  # repli sur BeautifulSoup
+    HTMLParser = None
+
+try:
+    import xxhash
+except ImportError:  # repli sur hash() intégré
+    xxhash = None
+
+try:
+    import ahocorasick
+except ImportError:  # repli sur une alternation regex
+    ahocorasick = None
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Expressions régulières compilées une seule fois au chargement du module
+_EXTERNAL_LINK_RE = re.compile(r'^https?://(?!tldr\.tech)')
+# Patterns typiques TLDR réunis en une seule alternation (un seul parcours du texte)
+_FALLBACK_RE = re.compile(
+    r'(?P<read>[A-Z][^.!?]*(?:minute read|min read))'
+    r'|(?P<link>(https?://[^\s]+)\s*[–-]\s*([^.!?]*))'
+    r'|(?P<paren>([A-Z][^.!?]*)\s*\((\d+)\s*minute?\s*read\))',
+    re.MULTILINE
+)
+# "N min" suivi ou non de "read"; "read in N min" est couvert par le cas sans suffixe
+_READING_TIME_RE = re.compile(r'(\d+)\s*(?:minute|min)(\s*read)?', re.IGNORECASE)
+_TITLE_CHAR_FILTER = CharFilter("-():.,!?")  # équivalent str.translate de [^\w\s\-\(\):\.,!?]
+# Fragments entre deux points (équivalent paresseux de text.split('.'))
+_SENTENCE_RE = re.compile(r'[^.]+')
+_TITLE_DURATION_RE = re.compile(r'\(\d+\s*(?:minute|min)\s*read\)', re.IGNORECASE)
+
+# Sélecteurs spécifiques TLDR, par ordre de priorité
+_ARTICLE_SELECTORS = [
+    'article',
+    '.story',
+    '.newsletter-item',
+    '.post-content',
+    '.content-section',
+    '[data-testid*="article"]',
+    '[id*="story"]'
+]
+
+# Équivalents des sélecteurs ci-dessus pour le repérage en streaming
+_SECTION_CLASSES = frozenset({'story', 'newsletter-item', 'post-content', 'content-section'})
+_STREAM_CHUNK_SIZE = 65536
+_TITLE_SELECTORS = ['h1', 'h2', 'h3', 'h4', '.title', '.headline', 'strong', 'b']
+
+
+def _build_matcher(words):
+    """Renvoie une fonction testant en un seul passage si un texte contient l'un des mots"""
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for word in words:
+            automaton.add_word(word, word)
+        automaton.make_automaton()
+        return lambda text: next(automaton.iter(text), None) is not None
+
+    pattern = re.compile('|'.join(map(re.escape, words)))
+    return lambda text: pattern.search(text) is not None
+
+
+_has_link_exclusion = _build_matcher([
+    'unsubscribe', 'subscribe', 'footer', 'header',
+    'privacy', 'terms', 'about', 'contact', 'sponsor',
+    'advertise', 'jobs', 'careers', 'support',
+    'twitter.com', 'linkedin.com', 'facebook.com',
+    'instagram.com', 'youtube.com', 'tiktok.com',
+    'tldr.tech/unsubscribe', 'tldr.tech/jobs',
+    'tldr.tech/sponsor', 'tldr.tech/advertise',
+    'mailto:', 'tel:', 'javascript:',
+    # Exclusions spécifiques TLDR
+    'tldr.tech/marketing', 'tldr.tech/ai', 'tldr.tech/crypto',
+    '/unsubscribe', '/subscribe', '/privacy'
+])
+_has_quality_domain = _build_matcher([
+    'github.com', 'medium.com', 'dev.to', 'stackoverflow.com',
+    'techcrunch.com', 'theverge.com', 'arstechnica.com', 'wired.com',
+    'engadget.com', 'venturebeat.com', 'hackernews', 'reddit.com',
+    'blog.', 'docs.', 'research.', 'paper', 'arxiv.org',
+    'news.', 'press.', 'announce'
+])
+_has_title_skip = _build_matcher([
+    'subscribe', 'unsubscribe', 'privacy policy',
+    'terms of service', 'contact us', 'sponsor',
+    'advertise', 'newsletter', 'tldr', 'sign up'
+])
+_has_summary_skip = _build_matcher(['click here', 'read more', 'subscribe', 'minute read'])
+
+
+def _dedup_key(text: str) -> int:
+    """Empreinte 64 bits d'un texte pour la déduplication (xxh3 si disponible)"""
+    if xxhash is not None:
+        return xxhash.xxh3_64_intdigest(text.encode('utf-8'))
+    return hash(text)
+
+# Nombre maximal de traductions DeepL gardées en mémoire
+TRANSLATION_CACHE_SIZE = 1024
+
+
+def _build_session(headers: Dict[str, str] = None) -> requests.Session:
+    """Crée une session HTTP persistante (keep-alive + pool de connexions + retries)"""
+    session = requests.Session()
+    if headers:
+        session.headers.update(headers)
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+# Cache disque des jours fériés, partagé entre les exécutions
+HOLIDAYS_CACHE_PATH = Path.home() / ".tldr_robot" / "holidays.json"
+HOLIDAYS_CACHE_TTL = 30 * 86400  # 30 jours
+HOLIDAYS_API_URL = "https://date.nager.at/api/v3"
+
+
+@lru_cache(maxsize=1)
+def _holidays_session() -> requests.Session:
+    """Session HTTP partagée pour l'API date.nager.at"""
+    return _build_session()
+
+
+def _read_holidays_cache() -> Dict[str, Dict[str, Any]]:
+    """Charge le cache disque des jours fériés ({"US-2025": {"ts": ..., "days": [...]}})"""
+    try:
+        with open(HOLIDAYS_CACHE_PATH, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_holidays_cache(cache: Dict[str, Dict[str, Any]]):
+    """Écrit le cache disque de façon atomique (fichier temporaire + os.replace)"""
+    try:
+        HOLIDAYS_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=HOLIDAYS_CACHE_PATH.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(cache, f)
+            os.replace(tmp_path, HOLIDAYS_CACHE_PATH)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError as e:
+        logger.warning(f"Impossible d'écrire le cache des jours fériés: {e}")
+
+
 class SmartDateHandler:
     """Gestionnaire intelligent de dates pour éviter weekends et jours fériés"""
     
@@ -15,42 +190,69 @@ class SmartDateHandler:
         self.country_code = country_code
         self.max_days_back = max_days_back
         self.holidays_cache = {}
-        self.base_url = "https://date.nager.at/api/v3"
-        
-    def get_holidays_for_year(self, year: int) -> List[str]:
+        self.base_url = HOLIDAYS_API_URL
+        # Calendrier des jours ouvrables, construit à la demande année par année
+        self._calendar_years = set()
+        self._business_days: FrozenSet[date] = frozenset()
+        self._sorted_business_days: List[date] = []
+
+    def get_holidays_for_year(self, year: int) -> FrozenSet[str]:
         """Récupère les jours fériés pour une année donnée"""
-        if year in self.holidays_cache:
-            return self.holidays_cache[year]
-        
+        if year not in self.holidays_cache:
+            self.holidays_cache[year] = self._fetch_holidays(year, self.country_code)
+        return self.holidays_cache[year]
+
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _fetch_holidays(year: int, country_code: str) -> FrozenSet[str]:
+        """Jours fériés depuis le cache disque (TTL 30 jours) ou l'API date.nager.at"""
+        key = f"{country_code}-{year}"
+        cache = _read_holidays_cache()
+        entry = cache.get(key)
+        if entry and time.time() - entry.get('ts', 0) < HOLIDAYS_CACHE_TTL:
+            return frozenset(entry['days'])
+
         try:
-            url = f"{self.base_url}/publicholidays/{year}/{self.country_code}"
-            response = requests.get(url, timeout=5)
+            url = f"{HOLIDAYS_API_URL}/publicholidays/{year}/{country_code}"
+            response = _holidays_session().get(url, timeout=5)
             response.raise_for_status()
-            
-            holidays_data = response.json()
-            holidays = [holiday['date'] for holiday in holidays_data]
-            self.holidays_cache[year] = holidays
-            
-            return holidays
-            
+
+            holidays = [holiday['date'] for holiday in response.json()]
+            cache[key] = {'ts': time.time(), 'days': holidays}
+            _write_holidays_cache(cache)
+
+            return frozenset(holidays)
+
         except Exception as e:
             logger.warning(f"Erreur API jours fériés: {e}, utilisation fallback")
-            fallback_holidays = [
+            # Entrée expirée plutôt que rien, sinon jours fériés fixes
+            if entry:
+                return frozenset(entry['days'])
+            return frozenset({
                 f"{year}-01-01", f"{year}-07-04", f"{year}-12-25", f"{year}-12-31"
-            ]
-            self.holidays_cache[year] = fallback_holidays
-            return fallback_holidays
+            })
     
+    def _build_calendar(self, year: int):
+        """Ajoute au calendrier les jours ouvrables (lun-ven hors fériés) d'une année"""
+        if year in self._calendar_years:
+            return
+
+        holidays = {date.fromisoformat(day) for day in self.get_holidays_for_year(year)}
+        current_date = date(year, 1, 1)
+        year_days = []
+        while current_date.year == year:
+            if current_date.weekday() < 5 and current_date not in holidays:
+                year_days.append(current_date)
+            current_date += timedelta(days=1)
+
+        self._calendar_years.add(year)
+        self._business_days = self._business_days.union(year_days)
+        self._sorted_business_days = sorted(self._business_days)
+
     def is_business_day(self, target_date: date) -> bool:
         """Vérifie si une date est un jour ouvrable"""
-        # Weekend check
-        if target_date.weekday() >= 5:
-            return False
-        
-        # Holiday check
-        holidays = self.get_holidays_for_year(target_date.year)
-        date_str = target_date.strftime("%Y-%m-%d")
-        return date_str not in holidays
+        self._build_calendar(target_date.year)
+        return target_date in self._business_days
     
     def get_last_business_day(self, from_date: date = None) -> date:
         """Trouve le dernier jour ouvrable"""
@@ -60,24 +262,39 @@ class SmartDateHandler:
         # Si c'est aujourd'hui et avant midi, prendre hier
         if from_date == date.today() and datetime.now().hour < 12:
             from_date = from_date - timedelta(days=1)
-        
-        current_date = from_date
-        days_checked = 0
-        
-        while days_checked < self.max_days_back:
-            if self.is_business_day(current_date):
-                return current_date
-            current_date -= timedelta(days=1)
-            days_checked += 1
-        
+
+        oldest_date = from_date - timedelta(days=self.max_days_back - 1)
+        self._build_calendar(from_date.year)
+        self._build_calendar(oldest_date.year)
+
+        # Recherche dichotomique du dernier jour ouvrable <= from_date
+        index = bisect_right(self._sorted_business_days, from_date)
+        if index and self._sorted_business_days[index - 1] >= oldest_date:
+            return self._sorted_business_days[index - 1]
+
         return from_date  # Fallback
 
+    def get_recent_business_days(self, count: int, from_date: date = None) -> List[date]:
+        """Liste les `count` derniers jours ouvrables, du plus récent au plus ancien"""
+        latest_date = self.get_last_business_day(from_date)
+        if not self.is_business_day(latest_date):
+            return [latest_date]
+
+        # Couvre l'année précédente si la fenêtre déborde sur le 1er janvier
+        index = bisect_right(self._sorted_business_days, latest_date)
+        if index < count:
+            self._build_calendar(latest_date.year - 1)
+            index = bisect_right(self._sorted_business_days, latest_date)
+
+        return self._sorted_business_days[max(index - count, 0):index][::-1]
+
 class TLDRScraper:
     """Niveau 1 - Découverte: Extraction des articles TLDR Tech optimisée avec dates intelligentes et traduction automatique"""
 
     def __init__(self, newsletter_type="tech", max_articles=20, country_code="US", year=None, month=None, day=None, target_language=None, deepl_api_key=None):
         self.newsletter_type = newsletter_type
         self.base_url = f"https://tldr.tech/{newsletter_type}"
+        self._source_tag = f'TLDR-{newsletter_type}'
         self.max_articles = max_articles
         self.date_handler = SmartDateHandler(country_code)
         self.year = year
@@ -98,22 +315,52 @@ class TLDRScraper:
 
         # Initialiser le traducteur DeepL si clé fournie
         self.translator = None
+        self._translation_cache = OrderedDict()
         if self.target_language and self.deepl_api_key:
-            try:
-                self.translator = deepl.Translator(self.deepl_api_key)
-            except Exception as e:
-                logger.warning(f"Erreur d'initialisation DeepL: {e}")
+            if deepl is None:
+                logger.warning("Module deepl non installé, traduction désactivée")
+            else:
+                try:
+                    self.translator = deepl.Translator(self.deepl_api_key)
+                except Exception as e:
+                    logger.warning(f"Erreur d'initialisation DeepL: {e}")
+
+        # Session persistante: réutilise la même connexion TLS pour toutes les requêtes
+        self.session = _build_session(self.headers)
+
+    def close(self):
+        """Ferme la session HTTP du scraper"""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
 
     def translate_text(self, text, target_lang=None):
         """Traduit un texte avec DeepL si activé"""
-        if not text or not self.translator or not (target_lang or self.target_language):
-            return text
-        try:
-            result = self.translator.translate_text(text, target_lang=(target_lang or self.target_language))
-            return result.text
-        except Exception as e:
-            logger.warning(f"Erreur traduction DeepL: {e}")
-            return text
+        return self.translate_texts([text], target_lang)[0]
+
+    def translate_texts(self, texts: List[str], target_lang=None) -> List[str]:
+        """Traduit une liste de textes en un seul appel DeepL (textes déjà traduits servis depuis le cache)"""
+        lang = target_lang or self.target_language
+        if not self.translator or not lang:
+            return list(texts)
+
+        cache = self._translation_cache
+        pending = list(dict.fromkeys(text for text in texts if text and (text, lang) not in cache))
+        if pending:
+            try:
+                results = self.translator.translate_text(pending, target_lang=lang)
+                for text, result in zip(pending, results):
+                    cache[(text, lang)] = result.text
+                while len(cache) > TRANSLATION_CACHE_SIZE:
+                    cache.popitem(last=False)
+            except Exception as e:
+                logger.warning(f"Erreur traduction DeepL: {e}")
+
+        return [cache.get((text, lang), text) if text else text for text in texts]
         
     def get_todays_newsletter(self) -> str:
         """Récupère l'URL de la newsletter du jour (jour ouvrable)"""
@@ -128,34 +375,92 @@ class TLDRScraper:
     
     def find_available_newsletter(self, max_attempts: int = 7) -> str:
         """NOUVEAU: Trouve une newsletter disponible en testant plusieurs dates"""
-        current_date = date.today()
-        
-        for attempt in range(max_attempts):
-            # Obtenir le jour ouvrable
-            business_date = self.date_handler.get_last_business_day(current_date)
-            url = f"{self.base_url}/{business_date.strftime('%Y-%m-%d')}"
-
-            if self._test_url_availability(url):
-                logger.info(f"✅ Newsletter trouvée: {business_date}")
-                return url
-            
-            logger.info(f"⏭️ {business_date} non disponible, test jour précédent")
-            current_date = business_date - timedelta(days=1)
-        
+        candidates = [
+            business_date.strftime('%Y-%m-%d')
+            for business_date in self.date_handler.get_recent_business_days(max_attempts)
+        ]
+
+        # Toutes les dates candidates sont testées en parallèle (~1 aller-retour réseau)
+        results = self._probe_dates(candidates)
+        if results:
+            date_str = results[0][0]
+            logger.info(f"✅ Newsletter trouvée: {date_str}")
+            return self.get_newsletter_by_date(date_str)
+
+        logger.info(f"⏭️ Aucune des dates {', '.join(candidates)} n'est disponible")
+
         # Fallback: retourner l'URL du jour
         logger.warning("⚠️ Aucune newsletter récente trouvée, utilisation date du jour")
         return self.get_todays_newsletter()
     
+    def _probe_dates(self, dates: List[str], fetch_content: bool = False) -> List[Tuple[str, Optional[bytes]]]:
+        """Teste plusieurs dates et renvoie celles disponibles, de la plus récente à la plus ancienne
+
+        Chaque résultat est un tuple (date, html); html contient les octets bruts
+        de la page, ou None si fetch_content est False.
+        """
+        if aiohttp is not None:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                try:
+                    return asyncio.run(self._probe_dates_async(dates, fetch_content))
+                except Exception as e:
+                    logger.warning(f"Sondage parallèle échoué: {e}, repli séquentiel")
+
+        # Repli séquentiel: aiohttp absent ou boucle asyncio déjà active.
+        # Arrêt à la première date disponible, sans télécharger les suivantes
+        for date_str in sorted(dates, reverse=True):
+            url = self.get_newsletter_by_date(date_str)
+            if not fetch_content:
+                if self._test_url_availability(url):
+                    return [(date_str, None)]
+                continue
+            try:
+                response = self.session.get(url, timeout=15)
+                if response.status_code == 200:
+                    return [(date_str, response.content)]
+            except Exception as e:
+                logger.warning(f"Test {date_str} échoué: {e}")
+        return []
+
+    async def _probe_dates_async(self, dates: List[str], fetch_content: bool = False) -> List[Tuple[str, Optional[bytes]]]:
+        """Lance toutes les requêtes HEAD (ou GET si fetch_content) simultanément"""
+        timeout = aiohttp.ClientTimeout(total=15 if fetch_content else 5)
+        connector = aiohttp.TCPConnector(limit=8, ttl_dns_cache=300)
+
+        async with aiohttp.ClientSession(connector=connector, headers=self.headers, timeout=timeout) as session:
+            async def probe(date_str: str) -> Tuple[str, int, Optional[bytes]]:
+                url = self.get_newsletter_by_date(date_str)
+                method = session.get if fetch_content else session.head
+                # Mêmes règles que le repli séquentiel: un HEAD n'est disponible que sur un 200
+                # direct (pas de redirection vers une page d'accueil), le GET suit les redirections
+                async with method(url, allow_redirects=fetch_content) as response:
+                    html = await response.read() if fetch_content and response.status == 200 else None
+                    return date_str, response.status, html
+
+            responses = await asyncio.gather(*(probe(d) for d in dates), return_exceptions=True)
+
+        results = []
+        for date_str, response in zip(dates, responses):
+            if isinstance(response, Exception):
+                logger.warning(f"Test {date_str} échoué: {response}")
+            elif response[1] == 200:
+                results.append((date_str, response[2]))
+        results.sort(key=lambda result: result[0], reverse=True)
+        return results
+
     def _test_url_availability(self, url: str) -> bool:
         """Test rapide si une URL retourne du contenu"""
         try:
-            response = requests.head(url, headers=self.headers, timeout=5)
+            response = self.session.head(url, timeout=5)
             return response.status_code == 200
         except:
             return False
     
     def scrape_articles(self, url: str = None) -> List[Dict[str, Any]]:
         """Extrait tous les articles de la newsletter TLDR avec gestion intelligente des dates ou date ciblée"""
+        auto_url = None
         if not url:
             # Si l'utilisateur a spécifié une année/mois(/jour), construire l'URL correspondante
             if self.year and self.month:
@@ -165,45 +470,21 @@ class TLDRScraper:
                     target_date = f"{self.year:04d}-{self.month:02d}-01"
                 url = self.get_newsletter_by_date(target_date)
             else:
-                url = self.find_available_newsletter()
+                url = auto_url = self.find_available_newsletter()
 
         try:
             logger.info(f"Scraping TLDR {self.newsletter_type}: {url}")
-            response = requests.get(url, headers=self.headers, timeout=30)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.content, 'html.parser')
-            articles = []
-
-            # Méthodes de scraping TLDR par ordre de priorité
-            scraping_methods = [
-                self._scrape_method_structured,
-                self._scrape_method_links,
-                self._scrape_method_fallback
-            ]
-
-            for method in scraping_methods:
-                articles = method(soup, url)
-                if articles:
-                    logger.info(f"Méthode réussie: {method.__name__}")
-                    break
+            content = self._fetch_page(url)
+            articles = self._scrape_page(content, url)
 
             # Si aucune méthode ne marche et que l'URL était auto-détectée,
-            # essayer avec une date manuelle
-            if not articles and url == self.find_available_newsletter():
+            # essayer avec une date manuelle (sans refaire le sondage réseau
+            # si la détection vient d'être faite)
+            if not articles and url == (auto_url or self.find_available_newsletter()):
                 logger.warning("Aucun article trouvé avec date auto, test avec dates manuelles")
                 return self._try_fallback_dates()
 
-            # Filtrer et nettoyer les articles
-            cleaned_articles = self._clean_and_validate_articles(articles)
-
-            # Limitation du nombre d'articles
-            if len(cleaned_articles) > self.max_articles:
-                logger.info(f"Limitation de {len(cleaned_articles)} à {self.max_articles} articles")
-                cleaned_articles = cleaned_articles[:self.max_articles]
-
-            logger.info(f"Extracted {len(cleaned_articles)} articles from {url}")
-            return cleaned_articles
+            return self._finalize_articles(articles, url)
 
         except Exception as e:
             logger.error(f"Error scraping {url}: {e}")
@@ -214,6 +495,102 @@ class TLDRScraper:
 
             return []
     
+    def _fetch_page(self, url: str, timeout: int = 30) -> bytes:
+        """Télécharge une page en streaming et s'arrête dès qu'elle contient assez de candidats
+
+        Un parser lxml incrémental compte au fil de l'eau les sections et les
+        liens d'articles: quand les deux méthodes de scraping ont de quoi remplir
+        leur tampon (2x sections, 3x liens), le reste de la page n'est pas téléchargé.
+        """
+        section_target = self.max_articles * 2
+        link_target = self.max_articles * 3
+        sections = links = 0
+        chunks = []
+        parser = etree.HTMLPullParser(events=('end',))
+
+        with self.session.get(url, stream=True, timeout=timeout) as response:
+            response.raise_for_status()
+
+            for chunk in response.iter_content(_STREAM_CHUNK_SIZE):
+                chunks.append(chunk)
+                parser.feed(chunk)
+
+                for _, elem in parser.read_events():
+                    if not isinstance(elem.tag, str):  # commentaires, instructions
+                        continue
+                    if elem.tag == 'a':
+                        href = elem.get('href') or ''
+                        if (_EXTERNAL_LINK_RE.match(href) and
+                                self._is_article_link(href, ''.join(elem.itertext()).strip())):
+                            links += 1
+                    elif self._is_section_element(elem):
+                        sections += 1
+
+                if sections >= section_target and links >= link_target:
+                    logger.info(f"Assez de candidats après {sum(map(len, chunks))} octets, arrêt du téléchargement")
+                    break
+
+        return b''.join(chunks)
+
+    @staticmethod
+    def _is_section_element(elem) -> bool:
+        """Vérifie si un élément lxml correspond à l'un des sélecteurs de section TLDR"""
+        return (
+            elem.tag == 'article' or
+            not _SECTION_CLASSES.isdisjoint((elem.get('class') or '').split()) or
+            'article' in (elem.get('data-testid') or '') or
+            'story' in (elem.get('id') or '')
+        )
+
+    async def scrape_articles_async(self, urls: List[str]) -> List[List[Dict[str, Any]]]:
+        """Extrait en parallèle les articles de plusieurs pages (une liste d'articles par URL)"""
+        loop = asyncio.get_running_loop()
+
+        if aiohttp is None:
+            # Repli: scrape_articles synchrone dans des threads
+            return list(await asyncio.gather(
+                *(loop.run_in_executor(None, self.scrape_articles, url) for url in urls)
+            ))
+
+        # Téléchargement simultané de toutes les pages
+        connector = aiohttp.TCPConnector(limit=16, keepalive_timeout=30)
+        timeout = aiohttp.ClientTimeout(total=30)
+        async with aiohttp.ClientSession(headers=self.headers, connector=connector, timeout=timeout) as session:
+            async def fetch(url: str) -> bytes:
+                logger.info(f"Scraping TLDR {self.newsletter_type}: {url}")
+                async with session.get(url) as response:
+                    response.raise_for_status()
+                    return await response.read()
+
+            pages = await asyncio.gather(*(fetch(url) for url in urls), return_exceptions=True)
+
+        # Parsing déporté dans un pool de threads pour ne pas bloquer la boucle
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            tasks = []
+            for url, page in zip(urls, pages):
+                if isinstance(page, Exception):
+                    logger.error(f"Error scraping {url}: {page}")
+                    tasks.append(asyncio.sleep(0, result=[]))
+                else:
+                    tasks.append(loop.run_in_executor(executor, self._parse_page, page, url))
+            return list(await asyncio.gather(*tasks))
+
+    def _parse_page(self, content: bytes, url: str) -> List[Dict[str, Any]]:
+        """Extrait, nettoie et limite les articles d'une page déjà téléchargée"""
+        return self._finalize_articles(self._scrape_page(content, url), url)
+
+    def _finalize_articles(self, articles: List[Dict[str, Any]], url: str) -> List[Dict[str, Any]]:
+        """Filtre, nettoie et limite le nombre d'articles extraits"""
+        cleaned_articles = self._clean_and_validate_articles(articles)
+
+        # Limitation du nombre d'articles
+        if len(cleaned_articles) > self.max_articles:
+            logger.info(f"Limitation de {len(cleaned_articles)} à {self.max_articles} articles")
+            cleaned_articles = cleaned_articles[:self.max_articles]
+
+        logger.info(f"Extracted {len(cleaned_articles)} articles from {url}")
+        return cleaned_articles
+
     def _try_fallback_dates(self) -> List[Dict[str, Any]]:
         """NOUVEAU: Essaie plusieurs dates en cas d'échec"""
         fallback_dates = [
@@ -221,26 +598,16 @@ class TLDRScraper:
             "2025-06-19", "2025-06-18", "2025-06-17"
         ]
         
-        for date_str in fallback_dates:
+        # Les pages de toutes les dates sont récupérées en parallèle
+        for date_str, html in self._probe_dates(fallback_dates, fetch_content=True):
             try:
                 url = self.get_newsletter_by_date(date_str)
-                if self._test_url_availability(url):
-                    logger.info(f"✅ Date de fallback réussie: {date_str}")
-                    
-                    response = requests.get(url, headers=self.headers, timeout=15)
-                    response.raise_for_status()
-                    
-                    soup = BeautifulSoup(response.content, 'html.parser')
-                    
-                    # Essayer les méthodes de scraping
-                    for method in [self._scrape_method_structured, self._scrape_method_links]:
-                        articles = method(soup, url)
-                        if articles:
-                            cleaned = self._clean_and_validate_articles(articles)
-                            if len(cleaned) > self.max_articles:
-                                cleaned = cleaned[:self.max_articles]
-                            return cleaned
-                            
+                logger.info(f"✅ Date de fallback réussie: {date_str}")
+
+                articles = self._scrape_page(html, url, text_fallback=False)
+                if articles:
+                    return self._finalize_articles(articles, url)
+
             except Exception as e:
                 logger.warning(f"Fallback {date_str} échoué: {e}")
                 continue
@@ -248,28 +615,139 @@ class TLDRScraper:
         logger.error("❌ Toutes les dates de fallback ont échoué")
         return []
     
-    def _scrape_method_structured(self, soup, url: str) -> List[Dict[str, Any]]:
+    def _scrape_page(self, content: bytes, url: str, text_fallback: bool = True) -> List[Dict[str, Any]]:
+        """Applique les méthodes de scraping TLDR par ordre de priorité"""
+        # Horodatage partagé par tous les articles de la page; variable locale passée aux
+        # extracteurs, car plusieurs pages sont analysées en parallèle (scrape_articles_async)
+        extraction_ts = datetime.now().isoformat()
+
+        # Chemin rapide: selectolax parse la page en C sans construire d'objets Python par nœud
+        if HTMLParser is not None:
+            tree = HTMLParser(content)
+            for method in [self._scrape_fast_structured, self._scrape_fast_links]:
+                articles = method(tree, url, extraction_ts)
+                if articles:
+                    logger.info(f"Méthode réussie: {method.__name__}")
+                    return articles
+
+        # Repli BeautifulSoup (selectolax absent ou page atypique)
+        soup = BeautifulSoup(content, 'lxml')
+        scraping_methods = [self._scrape_method_structured, self._scrape_method_links]
+        if text_fallback:
+            scraping_methods.append(self._scrape_method_fallback)
+
+        for method in scraping_methods:
+            articles = method(soup, url, extraction_ts)
+            if articles:
+                logger.info(f"Méthode réussie: {method.__name__}")
+                return articles
+
+        return []
+
+    def _scrape_fast_structured(self, tree, url: str, extraction_ts: str) -> List[Dict[str, Any]]:
+        """Méthode 1 (selectolax): Scraping basé sur la structure TLDR"""
+        articles = []
+
+        for selector in _ARTICLE_SELECTORS:
+            sections = tree.css(selector)
+            if sections:
+                logger.info(f"Found {len(sections)} sections with selector: {selector}")
+
+                for section in sections:
+                    article = self._extract_article_from_node(section, extraction_ts)
+                    if article:
+                        articles.append(article)
+
+                        if len(articles) >= self.max_articles * 2:  # Buffer pour le nettoyage
+                            break
+
+                if articles:
+                    break
+
+        return articles
+
+    def _scrape_fast_links(self, tree, url: str, extraction_ts: str) -> List[Dict[str, Any]]:
+        """Méthode 2 (selectolax): Extraction basée sur les liens externes"""
+        articles = []
+        filtered_links = []
+
+        # Un seul parcours de tous les liens de la page
+        for node in tree.css('a[href]'):
+            href = node.attributes.get('href') or ''
+            if not _EXTERNAL_LINK_RE.match(href):
+                continue
+            title = node.text(strip=True)
+            if self._is_article_link(href, title):
+                filtered_links.append((node, href, title))
+                # Limite précoce pour éviter trop de liens
+                if len(filtered_links) >= self.max_articles * 3:
+                    break
+
+        logger.info(f"Filtered to {len(filtered_links)} potential article links")
+
+        for node, href, title in filtered_links:
+            # Remonter jusqu'à 3 niveaux pour trouver le contexte
+            parent = node.parent
+            context = ""
+            for _ in range(3):
+                if parent is None:
+                    break
+                context = parent.text(strip=True)
+                if len(context) > len(title) + 50:
+                    break
+                parent = parent.parent
+
+            article = self._build_link_article(href, title, context, extraction_ts)
+            if article:
+                articles.append(article)
+
+                if len(articles) >= self.max_articles * 2:
+                    break
+
+        return articles
+
+    def _extract_article_from_node(self, section, extraction_ts: str) -> Dict[str, Any]:
+        """Extrait un article d'un nœud selectolax"""
+        try:
+            title = ""
+            title_elem = None
+
+            for selector in _TITLE_SELECTORS:
+                title_elem = section.css_first(selector)
+                if title_elem is not None:
+                    title = title_elem.text(strip=True)
+                    if len(title) > 20:  # Titre suffisamment long
+                        break
+
+            if not title:
+                return None
+
+            # Lien de la section, sinon lien englobant le titre
+            link_elem = section.css_first('a[href]')
+            if link_elem is None and title_elem is not None:
+                link_elem = title_elem.parent
+                while link_elem is not None and link_elem.tag != 'a':
+                    link_elem = link_elem.parent
+
+            href = (link_elem.attributes.get('href') or '') if link_elem is not None else ''
+            return self._build_section_article(title, href, section.text(strip=True), section.text(), extraction_ts)
+
+        except Exception as e:
+            logger.error(f"Error extracting article from node: {e}")
+
+        return None
+
+    def _scrape_method_structured(self, soup, url: str, extraction_ts: str) -> List[Dict[str, Any]]:
         """Méthode 1: Scraping basé sur la structure TLDR"""
         articles = []
         
-        # Sélecteurs spécifiques TLDR
-        article_selectors = [
-            'article',
-            '.story',
-            '.newsletter-item',
-            '.post-content',
-            '.content-section',
-            '[data-testid*="article"]',
-            '[id*="story"]'
-        ]
-        
-        for selector in article_selectors:
+        for selector in _ARTICLE_SELECTORS:
             sections = soup.find_all(selector)
             if sections:
                 logger.info(f"Found {len(sections)} sections with selector: {selector}")
                 
                 for section in sections:
-                    article = self._extract_article_from_section(section, url)
+                    article = self._extract_article_from_section(section, url, extraction_ts)
                     if article:
                         articles.append(article)
                         
@@ -281,16 +759,16 @@ class TLDRScraper:
         
         return articles
     
-    def _scrape_method_links(self, soup, url: str) -> List[Dict[str, Any]]:
+    def _scrape_method_links(self, soup, url: str, extraction_ts: str) -> List[Dict[str, Any]]:
         """Méthode 2: Extraction basée sur les liens externes (AMÉLIORÉE)"""
         articles = []
         
         # Recherche de tous les liens externes
-        external_links = soup.find_all('a', href=re.compile(r'^https?://(?!tldr\.tech)'))
+        external_links = soup.find_all('a', href=_EXTERNAL_LINK_RE)
 
         filtered_links = []
         for link in external_links:
-            if self._is_article_link(link):
+            if self._is_article_link(link.get('href', ''), link.get_text(strip=True)):
                 filtered_links.append(link)
                 # Limite précoce pour éviter trop de liens
                 if len(filtered_links) >= self.max_articles * 3:
@@ -299,7 +777,7 @@ class TLDRScraper:
         logger.info(f"Filtered to {len(filtered_links)} potential article links")
         
         for link in filtered_links:
-            article = self._extract_article_from_link(link, url)
+            article = self._extract_article_from_link(link, url, extraction_ts)
             if article:
                 articles.append(article)
                 
@@ -308,87 +786,51 @@ class TLDRScraper:
         
         return articles
     
-    def _scrape_method_fallback(self, soup, url: str) -> List[Dict[str, Any]]:
+    def _scrape_method_fallback(self, soup, url: str, extraction_ts: str) -> List[Dict[str, Any]]:
         """Méthode 3: Fallback - extraction par patterns de texte"""
         articles = []
         text_content = soup.get_text()
         
-        # Patterns typiques TLDR
-        patterns = [
-            r'([A-Z][^.!?]*(?:minute read|min read))',
-            r'(https?://[^\s]+)\s*[–-]\s*([^.!?]*)',
-            r'([A-Z][^.!?]*)\s*\((\d+)\s*minute?\s*read\)'
-        ]
-        
-        for pattern in patterns:
-            matches = re.finditer(pattern, text_content, re.MULTILINE)
-            count = 0
-            for match in matches:
-                if count >= self.max_articles:  
-                    break
-                article = self._create_article_from_match(match, url)
-                if article:
-                    articles.append(article)
-                    count += 1
+        # Patterns typiques TLDR, au plus max_articles par type de pattern
+        counts = {'read': 0, 'link': 0, 'paren': 0}
+        for match in _FALLBACK_RE.finditer(text_content):
+            kind = match.lastgroup
+            if counts[kind] >= self.max_articles:
+                continue
+            article = self._create_article_from_match(match, url, extraction_ts)
+            if article:
+                articles.append(article)
+                counts[kind] += 1
         
         return articles
     
-    def _is_article_link(self, link) -> bool:
-        """Vérifie si un lien pointe vers un article (AMÉLIORATION)"""
-        href = link.get('href', '')
-        text = link.get_text(strip=True)
-
-        exclusions = [
-            'unsubscribe', 'subscribe', 'footer', 'header',
-            'privacy', 'terms', 'about', 'contact', 'sponsor',
-            'advertise', 'jobs', 'careers', 'support',
-            'twitter.com', 'linkedin.com', 'facebook.com',
-            'instagram.com', 'youtube.com', 'tiktok.com',
-            'tldr.tech/unsubscribe', 'tldr.tech/jobs',
-            'tldr.tech/sponsor', 'tldr.tech/advertise',
-            'mailto:', 'tel:', 'javascript:',
-            # Exclusions spécifiques TLDR
-            'tldr.tech/marketing', 'tldr.tech/ai', 'tldr.tech/crypto',
-            '/unsubscribe', '/subscribe', '/privacy'
-        ]
-        
-        # Vérification stricte des exclusions
+    def _is_article_link(self, href: str, text: str) -> bool:
+        """Vérifie si un lien (href + texte) pointe vers un article (AMÉLIORATION)"""
         href_lower = href.lower()
-        text_lower = text.lower()
-        
-        for exclusion in exclusions:
-            if exclusion in href_lower or exclusion in text_lower:
-                return False
+
+        # Vérification stricte des exclusions
+        if _has_link_exclusion(href_lower) or _has_link_exclusion(text.lower()):
+            return False
 
         # Le texte doit être assez long et descriptif
         if len(text) < 15:
             return False
 
-        quality_domains = [
-            'github.com', 'medium.com', 'dev.to', 'stackoverflow.com',
-            'techcrunch.com', 'theverge.com', 'arstechnica.com', 'wired.com',
-            'engadget.com', 'venturebeat.com', 'hackernews', 'reddit.com',
-            'blog.', 'docs.', 'research.', 'paper', 'arxiv.org',
-            'news.', 'press.', 'announce'
-        ]
-        
         # Si c'est un domaine de qualité, on accepte plus facilement
-        for domain in quality_domains:
-            if domain in href_lower:
-                return len(text) > 10
+        if _has_quality_domain(href_lower):
+            return len(text) > 10
         
         # Sinon, critères plus stricts
         return len(text) > 25 and href.startswith('http') and '.' in href
     
-    def _extract_article_from_section(self, section, base_url: str) -> Dict[str, Any]:
+    def _extract_article_from_section(self, section, base_url: str, extraction_ts: str) -> Dict[str, Any]:
         """Extrait un article d'une section HTML"""
         try:
             # Extraction du titre
-            title_selectors = ['h1', 'h2', 'h3', 'h4', '.title', '.headline', 'strong', 'b']
             title = ""
             title_elem = None
             
-            for selector in title_selectors:
+            for selector in _TITLE_SELECTORS:
                 title_elem = section.find(selector)
                 if title_elem:
                     title = title_elem.get_text(strip=True)
@@ -409,38 +851,45 @@ class TLDRScraper:
                     else:
                         link_elem = title_elem.find_parent('a')
             
-            url = ""
-            if link_elem:
-                href = link_elem.get('href', '')
-                if href.startswith('http'):
-                    url = href
-                elif href.startswith('/'):
-                    url = f"https://tldr.tech{href}"
-            
-            # Extraction du résumé
-            summary = self._extract_summary_from_section(section, title)
-            
-            # Extraction de la durée de lecture
-            duration = self._extract_reading_time(section.get_text())
-            
-            if title and (url or summary):
-                return {
-                    'titre': self._clean_title(title),
-                    'url': url,
-                    'duree_lecture': duration,
-                    'resume_tldr': summary,
-                    'contenu_brut': section.get_text(strip=True)[:500],
-                    'date_extraction': datetime.now().isoformat(),
-                    'source': f'TLDR-{self.newsletter_type}',
-                    'newsletter_type': self.newsletter_type
-                }
+            href = link_elem.get('href', '') if link_elem else ''
+            return self._build_section_article(
+                title, href, section.get_text(strip=True), section.get_text(), extraction_ts
+            )
                 
         except Exception as e:
             logger.error(f"Error extracting article from section: {e}")
         
         return None
+
+    def _build_section_article(self, title: str, href: str, text: str, raw_text: str, extraction_ts: str) -> Dict[str, Any]:
+        """Construit un article à partir du titre, du lien et du texte d'une section"""
+        url = ""
+        if href.startswith('http'):
+            url = href
+        elif href.startswith('/'):
+            url = f"https://tldr.tech{href}"
+
+        # Extraction du résumé
+        summary = self._extract_summary_from_text(text, title)
+
+        # Extraction de la durée de lecture
+        duration = self._extract_reading_time(raw_text)
+
+        if title and (url or summary):
+            return {
+                'titre': self._clean_title(title),
+                'url': url,
+                'duree_lecture': duration,
+                'resume_tldr': summary,
+                'contenu_brut': text[:500],
+                'date_extraction': extraction_ts,
+                'source': self._source_tag,
+                'newsletter_type': self.newsletter_type
+            }
+
+        return None
     
-    def _extract_article_from_link(self, link, base_url: str) -> Dict[str, Any]:
+    def _extract_article_from_link(self, link, base_url: str, extraction_ts: str) -> Dict[str, Any]:
         """Extrait un article à partir d'un lien externe"""
         try:
             url = link.get('href', '')
@@ -457,48 +906,58 @@ class TLDRScraper:
                     if len(context) > len(title) + 50:
                         break
                     parent = parent.parent
-            
-            # Extraire le résumé du contexte
-            summary = self._extract_summary_from_context(context, title)
-            duration = self._extract_reading_time(context)
-            
-            if title and url and len(title) > 10:
-                return {
-                    'titre': self._clean_title(title),
-                    'url': url,
-                    'duree_lecture': duration,
-                    'resume_tldr': summary,
-                    'contenu_brut': context[:500],
-                    'date_extraction': datetime.now().isoformat(),
-                    'source': f'TLDR-{self.newsletter_type}',
-                    'newsletter_type': self.newsletter_type
-                }
+
+            return self._build_link_article(url, title, context, extraction_ts)
                 
         except Exception as e:
             logger.error(f"Error extracting article from link: {e}")
         
         return None
+
+    def _build_link_article(self, url: str, title: str, context: str, extraction_ts: str) -> Dict[str, Any]:
+        """Construit un article à partir d'un lien externe et de son contexte"""
+        # Extraire le résumé du contexte
+        summary = self._extract_summary_from_context(context, title)
+        duration = self._extract_reading_time(context)
+
+        if title and url and len(title) > 10:
+            return {
+                'titre': self._clean_title(title),
+                'url': url,
+                'duree_lecture': duration,
+                'resume_tldr': summary,
+                'contenu_brut': context[:500],
+                'date_extraction': extraction_ts,
+                'source': self._source_tag,
+                'newsletter_type': self.newsletter_type
+            }
+
+        return None
     
-    def _extract_summary_from_section(self, section, title: str) -> str:
-        """Extrait le résumé d'une section"""
-        text = section.get_text(strip=True)
+    def _extract_summary_from_text(self, text: str, title: str) -> str:
+        """Extrait le résumé du texte d'une section"""
         
         # Supprimer le titre du texte
         if title in text:
             text = text.replace(title, '', 1).strip()
         
-        # Chercher des patterns de résumé
-        sentences = [s.strip() for s in text.split('.') if s.strip()]
-        
-        # Prendre les 2-3 premières phrases pertinentes
+        # Prendre les 2-3 premières phrases pertinentes parmi les 4 premières,
+        # sans découper le reste du texte
         summary_parts = []
-        for sentence in sentences[:4]:
-            if len(sentence) > 20 and not any(skip in sentence.lower() for skip in [
-                'click here', 'read more', 'subscribe', 'minute read'
-            ]):
+        summary_length = -1
+        sentences_seen = 0
+        for match in _SENTENCE_RE.finditer(text):
+            sentence = match.group().strip()
+            if not sentence:
+                continue
+            sentences_seen += 1
+            if len(sentence) > 20 and not _has_summary_skip(sentence.lower()):
                 summary_parts.append(sentence)
-                if len(' '.join(summary_parts)) > 150:
+                summary_length += len(sentence) + 1
+                if summary_length > 150:
                     break
+            if sentences_seen >= 4:
+                break
         
         summary = '. '.join(summary_parts[:3])
         return summary[:300] + "..." if len(summary) > 300 else summary
@@ -511,41 +970,36 @@ class TLDRScraper:
             if len(parts) > 1:
                 after_title = parts[1].strip()
                 # Prendre la première phrase significative
-                sentences = [s.strip() for s in after_title.split('.') if len(s.strip()) > 10]
-                if sentences:
-                    return sentences[0][:200]
+                for match in _SENTENCE_RE.finditer(after_title):
+                    sentence = match.group().strip()
+                    if len(sentence) > 10:
+                        return sentence[:200]
         
         return ""
     
     def _extract_reading_time(self, text: str) -> str:
         """Extrait la durée de lecture du texte"""
-        patterns = [
-            r'(\d+)\s*(?:minute|min)\s*read',
-            r'(\d+)\s*(?:minute|min)',
-            r'read\s*(?:in\s*)?(\d+)\s*(?:minute|min)'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
+        # Priorité au premier "N min read", sinon premier "N min"
+        first_minutes = None
+        for match in _READING_TIME_RE.finditer(text):
+            if match.group(2):
                 return f"{match.group(1)} minute read"
-        
-        return ""
+            if first_minutes is None:
+                first_minutes = match.group(1)
+
+        return f"{first_minutes} minute read" if first_minutes else ""
     
     def _clean_title(self, title: str) -> str:
         """Nettoie et formate le titre"""
-        # Supprimer les caractères indésirables
-        title = re.sub(r'[^\w\s\-\(\):\.,!?]', '', title)
-        
-        # Supprimer les patterns de durée du titre
-        title = re.sub(r'\(\d+\s*(?:minute|min)\s*read\)', '', title, flags=re.IGNORECASE)
+        # Supprimer les caractères indésirables, puis les patterns de durée du titre
+        title = _TITLE_DURATION_RE.sub('', title.translate(_TITLE_CHAR_FILTER))
         
         # Nettoyer les espaces
         title = ' '.join(title.split())
         
         return title.strip()
     
-    def _create_article_from_match(self, match, base_url: str) -> Dict[str, Any]:
+    def _create_article_from_match(self, match, base_url: str, extraction_ts: str) -> Dict[str, Any]:
         """Crée un article à partir d'une regex match"""
         try:
             full_match = match.group(0)
@@ -562,8 +1016,8 @@ class TLDRScraper:
                 'duree_lecture': self._extract_reading_time(full_match),
                 'resume_tldr': "",
                 'contenu_brut': full_match,
-                'date_extraction': datetime.now().isoformat(),
-                'source': f'TLDR-{self.newsletter_type}',
+                'date_extraction': extraction_ts,
+                'source': self._source_tag,
                 'newsletter_type': self.newsletter_type
             }
         except:
@@ -578,30 +1032,33 @@ class TLDRScraper:
         for article in articles:
             title = article.get('titre', '').strip()
             url = article.get('url', '').strip()
-            summary = article.get('resume_tldr', '').strip()
-
-            if (len(title) < 15 or  # Titre plus long requis
-                title.lower() in seen_titles or
-                (url and url in seen_urls) or
-                any(skip in title.lower() for skip in [
-                    'subscribe', 'unsubscribe', 'privacy policy', 
-                    'terms of service', 'contact us', 'sponsor',
-                    'advertise', 'newsletter', 'tldr', 'sign up'
-                ])):
+
+            if len(title) < 15:  # Titre plus long requis
                 continue
 
-            if url:
-                seen_urls.add(url)
-            seen_titles.add(title.lower())
+            title_key = _dedup_key(title.casefold())
+            url_key = _dedup_key(url) if url else None
+            if (title_key in seen_titles or
+                (url_key is not None and url_key in seen_urls) or
+                _has_title_skip(title.lower())):
+                continue
 
-            # Traduction si activée
-            if self.translator:
-                article['titre_traduit'] = self.translate_text(title)
-                article['resume_tldr_traduit'] = self.translate_text(summary)
+            if url_key is not None:
+                seen_urls.add(url_key)
+            seen_titles.add(title_key)
 
             cleaned.append(article)
 
             if len(cleaned) >= self.max_articles:
                 break
 
+        # Traduction si activée: titres et résumés en une seule requête DeepL
+        if self.translator and cleaned:
+            texts = [a.get('titre', '').strip() for a in cleaned]
+            texts += [a.get('resume_tldr', '').strip() for a in cleaned]
+            translated = self.translate_texts(texts)
+            for i, article in enumerate(cleaned):
+                article['titre_traduit'] = translated[i]
+                article['resume_tldr_traduit'] = translated[len(cleaned) + i]
+
         return cleaned
\ No newline at end of file
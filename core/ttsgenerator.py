@@ -1,21 +1,102 @@
-import pyttsx3
+import wave
 from pathlib import Path
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import List, Dict, Any
 import logging
-import re
 from datetime import datetime
 
+from utils.charfilter import CharFilter
+
+try:
+    import pyttsx3
+except ImportError:  # piper seul
+    pyttsx3 = None
+
+try:
+    from piper.voice import PiperVoice
+except ImportError:  # repli sur pyttsx3
+    PiperVoice = None
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+_FILENAME_CHAR_FILTER = CharFilter("-")  # équivalent str.translate de [^\w\s-]
+
+# Voix piper française attendue dans le dossier de sortie si aucun modèle n'est fourni
+PIPER_DEFAULT_MODEL = "fr_FR-siwis-medium.onnx"
+
 class TTSGenerator:
-    """Niveau 4 - Génération audio avec TTS"""
+    """Niveau 4 - Génération audio avec TTS
+
+    La synthèse tourne dans un thread dédié: les méthodes publiques renvoient
+    un Future dont on n'appelle .result() qu'au moment où le chemin du fichier
+    est nécessaire, ce qui laisse le scraping/stockage avancer en parallèle.
+    """
     
-    def __init__(self, output_dir: str = "audio_output"):
+    def __init__(self, output_dir: str = "audio_output", piper_model: str = None):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
-        self.engine = pyttsx3.init()
-        self._configure_voice()
+        self.piper_model = Path(piper_model) if piper_model else self.output_dir / PIPER_DEFAULT_MODEL
+        self._engine = None
+        self._piper_voice = None
+        self._piper_loaded = False
+        self._pending_engine_jobs = 0
+        # Un seul worker: le moteur pyttsx3 n'est pas thread-safe et appartient à ce thread
+        self._tts_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tts")
+
+    def close(self):
+        """Attend la fin des synthèses en cours et arrête le thread TTS"""
+        self._tts_pool.shutdown(wait=True)
+
+    @property
+    def engine(self):
+        """Moteur pyttsx3, initialisé à la première utilisation"""
+        if self._engine is None:
+            self._engine = pyttsx3.init()
+            self._configure_voice()
+        return self._engine
+
+    @property
+    def piper_voice(self):
+        """Voix piper (ONNX Runtime) chargée une fois, None si piper ou le modèle est absent"""
+        if not self._piper_loaded:
+            self._piper_loaded = True
+            if PiperVoice is not None and self.piper_model.exists():
+                try:
+                    self._piper_voice = PiperVoice.load(str(self.piper_model))
+                    logger.info(f"🎙️ Voix piper chargée: {self.piper_model.name}")
+                except Exception as e:
+                    logger.warning(f"Erreur chargement piper: {e}, utilisation pyttsx3")
+        return self._piper_voice
+
+    def _piper_to_wav(self, text: str, filepath):
+        """Écrit le WAV avec piper: synthesize_wav depuis piper-tts 1.3 (synthesize y renvoie
+        désormais un itérateur de segments audio), synthesize(text, wav_file) avant"""
+        voice = self.piper_voice
+        with wave.open(str(filepath), 'wb') as wav_file:
+            if hasattr(voice, 'synthesize_wav'):
+                voice.synthesize_wav(text, wav_file)
+            else:
+                voice.synthesize(text, wav_file)
+
+    def _queue_audio(self, text: str, filepath):
+        """Synthétise avec piper, sinon (ou en cas d'échec) met le texte en file dans le moteur pyttsx3"""
+        if self.piper_voice is not None:
+            try:
+                self._piper_to_wav(text, filepath)
+                return
+            except Exception as e:
+                if pyttsx3 is None:
+                    raise
+                logger.warning(f"Erreur synthèse piper: {e}, utilisation pyttsx3")
+        self.engine.save_to_file(text, str(filepath))
+        self._pending_engine_jobs += 1
+
+    def _flush_audio(self):
+        """Un seul runAndWait pour tous les textes mis en file dans pyttsx3"""
+        if self._pending_engine_jobs:
+            self._pending_engine_jobs = 0
+            self.engine.runAndWait()
     
     def _configure_voice(self):
         """Configure la voix TTS"""
@@ -29,7 +110,33 @@ class TTSGenerator:
         self.engine.setProperty('rate', 180)  # Vitesse de lecture
         self.engine.setProperty('volume', 0.9)  # Volume
     
-    def generate_audio_summary(self, synthesis: str, articles: List[Dict[str, Any]]) -> str:
+    def generate_audio_summary(self, synthesis: str, articles: List[Dict[str, Any]]) -> Future:
+        """Génère en arrière-plan le fichier audio du résumé (Future -> chemin ou None)"""
+        return self._tts_pool.submit(self._sync_generate_audio_summary, synthesis, articles)
+
+    def generate_audio_file(self, text: str, filepath: str) -> Future:
+        """Génère en arrière-plan un fichier audio pour un texte (Future -> chemin ou None)"""
+        return self._tts_pool.submit(self._sync_generate_audio_file, text, filepath)
+
+    def generate_individual_article_audio(self, article: Dict[str, Any]) -> Future:
+        """Génère en arrière-plan l'audio d'un article (Future -> chemin ou None)"""
+        return self._tts_pool.submit(self._sync_generate_individual_article_audio, article)
+
+    def generate_batch(self, articles: List[Dict[str, Any]]) -> Future:
+        """Génère en arrière-plan un audio par article (Future -> liste de chemins)"""
+        return self._tts_pool.submit(self._sync_generate_batch, articles)
+
+    def _sync_generate_audio_file(self, text: str, filepath: str) -> str:
+        """Génère un fichier audio pour un texte"""
+        try:
+            self._queue_audio(text, filepath)
+            self._flush_audio()
+            return str(filepath)
+        except Exception as e:
+            logger.error(f"Error generating audio: {e}")
+            return None
+
+    def _sync_generate_audio_summary(self, synthesis: str, articles: List[Dict[str, Any]]) -> str:
         """Génère un fichier audio du résumé"""
         try:
             # Prépare le texte complet
@@ -42,8 +149,8 @@ class TTSGenerator:
             filename = f"veille_tldr_{datetime.now().strftime('%Y%m%d')}.wav"
             filepath = self.output_dir / filename
             
-            self.engine.save_to_file(full_text, str(filepath))
-            self.engine.runAndWait()
+            self._queue_audio(full_text, filepath)
+            self._flush_audio()
             
             logger.info(f"Audio file generated: {filepath}")
             return str(filepath)
@@ -52,20 +159,28 @@ class TTSGenerator:
             logger.error(f"Error generating audio: {e}")
             return None
     
-    def generate_individual_article_audio(self, article: Dict[str, Any]) -> str:
+    def _sync_generate_individual_article_audio(self, article: Dict[str, Any]) -> str:
         """Génère un audio pour un article individuel"""
+        paths = self._sync_generate_batch([article])
+        return paths[0] if paths else None
+
+    def _sync_generate_batch(self, articles: List[Dict[str, Any]]) -> List[str]:
+        """Génère un audio par article (piper, ou pyttsx3 avec un seul runAndWait pour le lot)"""
         try:
-            text = f"Article: {article['titre']}. Résumé: {article['resume_tldr']}"
-            
-            safe_title = re.sub(r'[^\w\s-]', '', article['titre'][:50])
-            filename = f"article_{safe_title.replace(' ', '_')}.wav"
-            filepath = self.output_dir / filename
-            
-            self.engine.save_to_file(text, str(filepath))
-            self.engine.runAndWait()
-            
-            return str(filepath)
-            
+            paths = []
+            for article in articles:
+                text = f"Article: {article['titre']}. Résumé: {article['resume_tldr']}"
+
+                safe_title = article['titre'][:50].translate(_FILENAME_CHAR_FILTER)
+                filename = f"article_{safe_title.replace(' ', '_')}.wav"
+                filepath = self.output_dir / filename
+
+                self._queue_audio(text, filepath)
+                paths.append(str(filepath))
+
+            self._flush_audio()
+            return paths
+
         except Exception as e:
             logger.error(f"Error generating individual audio: {e}")
-            return None
+            return []
@@ -4,7 +4,13 @@ Script de migration rapide - Remplacement de Notion par SQLite dans TLDR_robot
 Modifie votre automation existante pour utiliser SQLite
 """
 
+import itertools
+import mmap
+import os
+import re
 import shutil
+import sys
+import tempfile
 from pathlib import Path
 import logging
 
@@ -12,6 +18,61 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Source unique du SQLiteIntegrator installé par la migration: le module versionné du dépôt
+SQLITE_INTEGRATOR_TEMPLATE = Path(__file__).resolve().parent / "core" / "sqliteintegrator.py"
+# Module dont il dépend (versions du schéma partagées avec sqlite_viewer.py)
+SCHEMA_VERSIONS_MODULE = Path(__file__).resolve().parent / "utils" / "schemaversions.py"
+
+# Bloc config du script d'automatisation: de "config = {" jusqu'à la première ligne commençant par "}"
+CONFIG_BLOCK_START = 'config = {'
+
+# Tampon du repli userspace: 1 Mio au lieu des 16-64 Kio par défaut
+COPY_BUFSIZE = 1024 * 1024
+
+def _kernel_copy(src, dst) -> bool:
+    """Copie côté noyau: copy_file_range (reflink sur btrfs/XFS, copie côté serveur sur NFS),
+    sinon sendfile. Retourne False si aucun des deux n'est utilisable."""
+    size = os.fstat(src.fileno()).st_size
+    for name in ('copy_file_range', 'sendfile'):
+        if not hasattr(os, name):
+            continue
+        offset = 0
+        try:
+            while offset < size:
+                if name == 'copy_file_range':
+                    sent = os.copy_file_range(src.fileno(), dst.fileno(), size - offset, offset, offset)
+                else:
+                    sent = os.sendfile(dst.fileno(), src.fileno(), offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+        except OSError:
+            pass
+        if offset >= size:
+            return True
+        # Appel non supporté par ce système de fichiers: on repart de zéro
+        dst.seek(0)
+        dst.truncate()
+    return False
+
+def _fast_copy(source: Path, dest: Path):
+    """Copie un fichier sans faire transiter les octets par Python quand c'est possible,
+    puis recopie les métadonnées comme shutil.copy2"""
+    with open(source, 'rb') as src, open(dest, 'wb') as dst:
+        if not (sys.platform.startswith('linux') and _kernel_copy(src, dst)):
+            shutil.copyfileobj(src, dst, length=COPY_BUFSIZE)
+    shutil.copystat(source, dest)
+
+def _mapped_lines(path: Path):
+    """Itère sur les lignes décodées d'un fichier projeté en mémoire (pages chargées à la demande)"""
+    with open(path, 'rb') as f:
+        # mmap refuse les fichiers vides
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for line in iter(mm.readline, b''):
+                yield line.decode('utf-8')
+
 def backup_existing_files():
     """Crée une sauvegarde des fichiers existants"""
     logger.info("💾 Création de la sauvegarde...")
@@ -28,223 +89,22 @@ def backup_existing_files():
         source = Path(file_path)
         if source.exists():
             dest = backup_dir / source.name
-            shutil.copy2(source, dest)
+            _fast_copy(source, dest)
             logger.info(f"   ✅ Sauvegardé: {file_path}")
     
     logger.info(f"📁 Sauvegarde créée dans: {backup_dir}")
     return backup_dir
 
 def create_sqlite_integrator():
-    """Crée le nouveau SQLiteIntegrator"""
-    
-    sqlite_code = '''import sqlite3
-import logging
-import json
-from typing import List, Dict, Any, Optional
-from datetime import datetime
-from pathlib import Path
-import time
-
-# Configuration du logging
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
-
-class SQLiteIntegrator:
-    """Remplacement de Notion par SQLite - Plus simple et plus fiable"""
-    
-    def __init__(self, db_path: str = "data/tldr_database.db"):
-        self.db_path = Path(db_path)
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self._init_database()
-        logger.info(f"✅ SQLite Database initialisée: {self.db_path}")
-    
-    def _init_database(self):
-        """Initialise la base de données avec les tables nécessaires"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            
-            # Table principale pour les articles
-            cursor.execute(\'\'\'
-                CREATE TABLE IF NOT EXISTS articles (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    titre TEXT NOT NULL,
-                    url TEXT,
-                    resume_tldr TEXT,
-                    etat TEXT DEFAULT \'Nouveau\',
-                    categories_ia TEXT,
-                    duree_lecture TEXT,
-                    date_extraction TEXT,
-                    source TEXT,
-                    newsletter_type TEXT,
-                    contenu_brut TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            \'\'\')
-            
-            # Table pour les synthèses quotidiennes
-            cursor.execute(\'\'\'
-                CREATE TABLE IF NOT EXISTS syntheses (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    date_synthese TEXT NOT NULL,
-                    newsletter_type TEXT NOT NULL,
-                    contenu TEXT NOT NULL,
-                    nb_articles INTEGER DEFAULT 0,
-                    temps_traitement REAL DEFAULT 0,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            \'\'\')
-            
-            # Table pour les rapports quotidiens
-            cursor.execute(\'\'\'
-                CREATE TABLE IF NOT EXISTS rapports (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    date_rapport TEXT NOT NULL,
-                    newsletter_type TEXT NOT NULL,
-                    articles_extraits INTEGER DEFAULT 0,
-                    articles_stockes INTEGER DEFAULT 0,
-                    succes BOOLEAN DEFAULT 0,
-                    erreurs TEXT,
-                    temps_traitement REAL DEFAULT 0,
-                    fichier_audio TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            \'\'\')
-            
-            conn.commit()
-    
-    def test_connection(self) -> bool:
-        """Test la connexion à la base SQLite"""
-        try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("SELECT COUNT(*) FROM articles")
-                count = cursor.fetchone()[0]
-                logger.info(f"✅ Base SQLite connectée ! ({count} articles)")
-                return True
-        except Exception as e:
-            logger.error(f"❌ Erreur connexion SQLite: {e}")
-            return False
-    
-    def bulk_add_articles(self, articles: List[Dict[str, Any]]) -> List[int]:
-        """Ajoute plusieurs articles en lot"""
-        article_ids = []
-        
-        if not articles:
-            return article_ids
-        
-        logger.info(f"📦 Ajout en lot de {len(articles)} articles à SQLite...")
-        
-        try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
-                for article in articles:
-                    categories_json = json.dumps(article.get(\'categories_ia\', []))
-                    
-                    cursor.execute(\'\'\'
-                        INSERT INTO articles (
-                            titre, url, resume_tldr, etat, categories_ia,
-                            duree_lecture, date_extraction, source, newsletter_type, contenu_brut
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    \'\'\', (
-                        article.get(\'titre\', \'\'),
-                        article.get(\'url\', \'\'),
-                        article.get(\'resume_tldr\', \'\'),
-                        article.get(\'etat\', \'Nouveau\'),
-                        categories_json,
-                        article.get(\'duree_lecture\', \'\'),
-                        article.get(\'date_extraction\', datetime.now().strftime(\'%Y-%m-%d\')),
-                        article.get(\'source\', \'\'),
-                        article.get(\'newsletter_type\', \'\'),
-                        article.get(\'contenu_brut\', \'\')
-                    ))
-                    
-                    article_ids.append(cursor.lastrowid)
-                
-                conn.commit()
-                logger.info(f"✅ {len(article_ids)} articles sauvegardés dans SQLite")
-                return article_ids
-                
-        except Exception as e:
-            logger.error(f"❌ Erreur ajout en lot: {e}")
-            return []
-    
-    def save_complete_daily_results(self, daily_results: Dict[str, Any]) -> Dict[str, Any]:
-        """Sauvegarde complète des résultats quotidiens dans SQLite"""
-        
-        saved_ids = {
-            \'articles\': [],
-            \'synthesis_id\': None,
-            \'report_id\': None
-        }
-        
-        try:
-            # 1. Ajouter tous les articles individuels
-            if daily_results.get(\'articles\'):
-                logger.info("💾 Sauvegarde des articles individuels...")
-                article_ids = self.bulk_add_articles(daily_results[\'articles\'])
-                saved_ids[\'articles\'] = article_ids
-                daily_results[\'articles_stored\'] = len(article_ids)
-            
-            # 2. Ajouter la synthèse
-            if daily_results.get(\'synthesis\'):
-                logger.info("💾 Sauvegarde de la synthèse...")
-                with sqlite3.connect(self.db_path) as conn:
-                    cursor = conn.cursor()
-                    cursor.execute(\'\'\'
-                        INSERT INTO syntheses (date_synthese, newsletter_type, contenu, nb_articles, temps_traitement)
-                        VALUES (?, ?, ?, ?, ?)
-                    \'\'\', (
-                        daily_results.get(\'date_formatted\', \'\'),
-                        daily_results.get(\'newsletter_type\', \'tech\'),
-                        daily_results.get(\'synthesis\', \'\'),
-                        daily_results.get(\'articles_extracted\', 0),
-                        daily_results.get(\'processing_time\', 0)
-                    ))
-                    saved_ids[\'synthesis_id\'] = cursor.lastrowid
-                    conn.commit()
-                logger.info("✅ Synthèse sauvegardée dans SQLite")
-            
-            # 3. Ajouter le rapport quotidien
-            logger.info("💾 Sauvegarde du rapport quotidien...")
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                erreurs_json = json.dumps(daily_results.get(\'errors\', []))
-                
-                cursor.execute(\'\'\'
-                    INSERT INTO rapports (
-                        date_rapport, newsletter_type, articles_extraits, articles_stockes,
-                        succes, erreurs, temps_traitement, fichier_audio
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                \'\'\', (
-                    daily_results.get(\'date_formatted\', \'\'),
-                    daily_results.get(\'newsletter_type\', \'tech\'),
-                    daily_results.get(\'articles_extracted\', 0),
-                    daily_results.get(\'articles_stored\', 0),
-                    daily_results.get(\'success\', False),
-                    erreurs_json,
-                    daily_results.get(\'processing_time\', 0),
-                    daily_results.get(\'audio_file\', \'\')
-                ))
-                saved_ids[\'report_id\'] = cursor.lastrowid
-                conn.commit()
-            logger.info("✅ Rapport sauvegardé dans SQLite")
-            
-            # Résumé final
-            total_elements = len(saved_ids[\'articles\']) + (1 if saved_ids[\'synthesis_id\'] else 0) + (1 if saved_ids[\'report_id\'] else 0)
-            logger.info(f"✅ Sauvegarde SQLite terminée: {total_elements} éléments créés")
-            
-            return saved_ids
-            
-        except Exception as e:
-            logger.error(f"❌ Erreur lors de la sauvegarde complète: {e}")
-            return saved_ids
-'''
+    """Installe le SQLiteIntegrator du dépôt (core/sqliteintegrator.py) dans le projet migré"""
     
-    # Écrire le fichier
+    # Copier le module et sa dépendance (rien à faire si la migration tourne dans le dépôt lui-même)
     sqlite_path = Path("core/sqliteintegrator.py")
-    with open(sqlite_path, 'w', encoding='utf-8') as f:
-        f.write(sqlite_code)
+    for source, dest in ((SQLITE_INTEGRATOR_TEMPLATE, sqlite_path),
+                         (SCHEMA_VERSIONS_MODULE, Path("utils/schemaversions.py"))):
+        if not (dest.exists() and dest.samefile(source)):
+            dest.parent.mkdir(exist_ok=True)
+            _fast_copy(source, dest)
     
     logger.info(f"✅ SQLiteIntegrator créé: {sqlite_path}")
     return sqlite_path
@@ -258,10 +118,6 @@ def modify_monthly_automation():
         logger.error(f"❌ Fichier non trouvé: {automation_path}")
         return False
     
-    # Lire le fichier existant
-    with open(automation_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
     # Modifications nécessaires
     modifications = [
         # Remplacer l'import Notion par SQLite
@@ -291,9 +147,10 @@ def modify_monthly_automation():
         ("'notion_database_id': '21e", "# Plus besoin de database ID"),
     ]
     
-    # Appliquer les modifications
-    for old, new in modifications:
-        content = content.replace(old, new)
+    # Toutes les substitutions en une seule regex
+    # (clés les plus longues d'abord pour que "MonthlyTLDRAutomationNotion" passe avant "Notion")
+    replacements = dict(modifications)
+    keys_pattern = re.compile("|".join(re.escape(old) for old in sorted(replacements, key=len, reverse=True)))
     
     # Configuration spéciale pour SQLite
     sqlite_config = '''    # Configuration - SQLITE OBLIGATOIRE pour cette version
@@ -314,11 +171,6 @@ def modify_monthly_automation():
         'audio_output_dir': './audio_summaries'
     }'''
     
-    # Remplacer la section config
-    import re
-    config_pattern = r'config = \{[^}]+\}'
-    content = re.sub(config_pattern, sqlite_config, content, flags=re.DOTALL)
-    
     # Ajouter un commentaire en haut
     header = '''#!/usr/bin/env python3
 """
@@ -328,20 +180,56 @@ Version migrée automatiquement - Plus de problèmes Notion !
 
 '''
     
-    # Remplacer le header existant
-    if content.startswith('#!/usr/bin/env python3'):
-        lines = content.split('\n')
-        # Garder seulement à partir de la première ligne d'import
-        for i, line in enumerate(lines):
-            if line.startswith('import ') or line.startswith('from '):
-                content = '\n'.join(lines[i:])
-                break
-    
-    content = header + content
-    
-    # Écrire le fichier modifié
-    with open(automation_path, 'w', encoding='utf-8') as f:
-        f.write(content)
+    # Réécriture ligne à ligne vers un fichier temporaire du même dossier,
+    # puis remplacement atomique: seule la ligne courante est en mémoire
+    tmp = tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=automation_path.parent,
+                                      suffix='.tmp', delete=False)
+    try:
+        src = _mapped_lines(automation_path)
+        with tmp:
+            tmp.write(header)
+            
+            # Remplacer le header existant: garder seulement à partir de la première ligne d'import
+            first_line = next(src, '')
+            skipping_header = first_line.startswith('#!/usr/bin/env python3')
+            header_lines = []
+            config_lines = None
+            
+            for line in itertools.chain([first_line], src):
+                line = keys_pattern.sub(lambda match: replacements[match.group(0)], line)
+                
+                if skipping_header:
+                    if not (line.startswith('import ') or line.startswith('from ')):
+                        header_lines.append(line)
+                        continue
+                    skipping_header = False
+                    header_lines = []
+                
+                # Remplacer la section config
+                if config_lines is None:
+                    start = line.find(CONFIG_BLOCK_START)
+                    if start == -1:
+                        tmp.write(line)
+                    else:
+                        config_lines = [line]
+                    continue
+                
+                stripped = line.lstrip()
+                if stripped.startswith('}'):
+                    config_line = config_lines[0]
+                    tmp.write(config_line[:config_line.find(CONFIG_BLOCK_START)] + sqlite_config + stripped[1:])
+                    config_lines = None
+                else:
+                    config_lines.append(line)
+            
+            # Pas de ligne d'import ou bloc config non fermé: texte d'origine conservé
+            tmp.writelines(header_lines)
+            tmp.writelines(config_lines or [])
+        
+        os.replace(tmp.name, automation_path)
+    except Exception:
+        os.unlink(tmp.name)
+        raise
     
     logger.info(f"✅ Automatisation modifiée: {automation_path}")
     return True
@@ -484,7 +372,7 @@ def rollback_migration():
         target = Path(target_path)
         
         if backup_path.exists():
-            shutil.copy2(backup_path, target)
+            _fast_copy(backup_path, target)
             logger.info(f"✅ Restauré: {target_path}")
     
     # Supprimer les fichiers SQLite
@@ -496,6 +384,10 @@ def rollback_migration():
     
     for file_path in sqlite_files:
         file_to_remove = Path(file_path)
+        # Le module du dépôt sert de source à create_sqlite_integrator: on le conserve
+        if file_to_remove.exists() and file_to_remove.samefile(SQLITE_INTEGRATOR_TEMPLATE):
+            logger.info(f"📌 Conservé (source de la migration): {file_path}")
+            continue
         if file_to_remove.exists():
             file_to_remove.unlink()
             logger.info(f"🗑️ Supprimé: {file_path}")
@@ -3,6 +3,8 @@
 🚀 Lanceur pour le Dashboard Streamlit TLDR
 """
 
+import importlib.metadata
+import importlib.util
 import subprocess
 import sys
 import os
@@ -15,13 +17,17 @@ logger = logging.getLogger(__name__)
 
 def check_streamlit_installation():
     """Vérifie si Streamlit est installé"""
-    try:
-        import streamlit
-        logger.info(f"✅ Streamlit {streamlit.__version__} installé")
-        return True
-    except ImportError:
+    # find_spec localise le paquet sans l'exécuter (pas de chargement de pandas/pyarrow)
+    if importlib.util.find_spec("streamlit") is None:
         logger.error("❌ Streamlit non installé")
         return False
+    
+    try:
+        version = importlib.metadata.version("streamlit")
+    except importlib.metadata.PackageNotFoundError:
+        version = "?"
+    logger.info(f"✅ Streamlit {version} installé")
+    return True
 
 def install_requirements():
     """Installe les dépendances Streamlit"""
@@ -31,12 +37,11 @@ def install_requirements():
         # Installer depuis requirements-streamlit.txt si disponible
         req_file = Path("requirements-streamlit.txt")
         if req_file.exists():
-            subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", str(req_file)])
+            subprocess.check_call([sys.executable, "-m", "pip", "install", "--no-input", "-r", str(req_file)])
         else:
-            # Installation manuelle des packages essentiels
+            # Installation manuelle des packages essentiels (un seul appel: pip résout tout en une fois)
             packages = ["streamlit>=1.28.0", "plotly>=5.17.0", "pandas>=2.0.0"]
-            for package in packages:
-                subprocess.check_call([sys.executable, "-m", "pip", "install", package])
+            subprocess.check_call([sys.executable, "-m", "pip", "install", "--no-input", *packages])
         
         logger.info("✅ Dépendances installées avec succès")
         return True
@@ -79,6 +84,13 @@ def launch_dashboard():
             "--browser.gatherUsageStats=false"
         ]
         
+        # POSIX: le lanceur est remplacé par Streamlit (pas de second interpréteur en mémoire)
+        if os.name == "posix":
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os.execv(sys.executable, cmd)
+        
+        # Windows: execv y lance un processus séparé et rend la main, on garde subprocess
         subprocess.run(cmd)
         return True
         
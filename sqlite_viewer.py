@@ -7,15 +7,216 @@ Consultez et exportez vos données facilement
 import sqlite3
 import json
 import csv
+import hashlib
+import os
+import queue
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+from functools import lru_cache
 import logging
 
+from utils.schemaversions import mark_schema_sql, schema_is_current
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
 # Configuration du logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Tampon d'écriture des exports (1 Mio): moins d'appels write() pour les gros fichiers
+EXPORT_BUFFER_SIZE = 1 << 20
+
+# contenu_brut peut être stocké compressé (BLOB zstd) par le SQLiteIntegrator
+_ZSTD_D = zstandard.ZstdDecompressor() if zstandard is not None else None
+
+
+@lru_cache(maxsize=None)
+def _log_missing_zstandard():
+    """Signale une seule fois qu'un contenu compressé ne peut pas être relu"""
+    logger.error("❌ Contenu brut compressé (zstd) illisible: installez zstandard")
+
+
+def _unpack_contenu(value: Any) -> Any:
+    """Décompresse le contenu brut lu en base (None si le BLOB ne peut pas être relu)"""
+    if isinstance(value, bytes):
+        if _ZSTD_D is None:
+            _log_missing_zstandard()
+            return None
+        return _ZSTD_D.decompress(value).decode('utf-8')
+    return value
+
+# Connexions en lecture seule partagées par les méthodes du viewer
+READ_POOL_SIZE = 4
+READ_PRAGMAS = (
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+)
+
+# Index plein texte FTS5 à contenu externe: les triggers le gardent synchronisé avec articles
+FTS_SCHEMA = '''
+BEGIN;
+CREATE VIRTUAL TABLE articles_fts USING fts5(
+    titre, resume_tldr, content='articles', content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS articles_fts_ai AFTER INSERT ON articles BEGIN
+    INSERT INTO articles_fts(rowid, titre, resume_tldr) VALUES (new.id, new.titre, new.resume_tldr);
+END;
+CREATE TRIGGER IF NOT EXISTS articles_fts_ad AFTER DELETE ON articles BEGIN
+    INSERT INTO articles_fts(articles_fts, rowid, titre, resume_tldr) VALUES ('delete', old.id, old.titre, old.resume_tldr);
+END;
+CREATE TRIGGER IF NOT EXISTS articles_fts_au AFTER UPDATE ON articles BEGIN
+    INSERT INTO articles_fts(articles_fts, rowid, titre, resume_tldr) VALUES ('delete', old.id, old.titre, old.resume_tldr);
+    INSERT INTO articles_fts(rowid, titre, resume_tldr) VALUES (new.id, new.titre, new.resume_tldr);
+END;
+INSERT INTO articles_fts(articles_fts) VALUES ('rebuild');
+COMMIT;
+'''
+
+# Catégories normalisées (une ligne par article et catégorie), alimentées par triggers
+# depuis le JSON categories_ia; même schéma que celui créé par le SQLiteIntegrator.
+# La version n'est enregistrée (schema_versions) qu'après le remplissage: c'est elle qui marque la migration
+CATEGORIES_SCHEMA = f'''
+BEGIN;
+CREATE TABLE IF NOT EXISTS article_categories (
+    article_id INTEGER NOT NULL REFERENCES articles(id),
+    category TEXT NOT NULL,
+    PRIMARY KEY (article_id, category)
+);
+CREATE INDEX IF NOT EXISTS idx_article_categories_category ON article_categories(category);
+CREATE TRIGGER IF NOT EXISTS article_categories_ai AFTER INSERT ON articles
+WHEN json_valid(new.categories_ia) AND json_type(new.categories_ia) = 'array'
+BEGIN
+    INSERT OR IGNORE INTO article_categories (article_id, category)
+    SELECT new.id, value FROM json_each(new.categories_ia) WHERE type = 'text';
+END;
+CREATE TRIGGER IF NOT EXISTS article_categories_ad AFTER DELETE ON articles BEGIN
+    DELETE FROM article_categories WHERE article_id = old.id;
+END;
+CREATE TRIGGER IF NOT EXISTS article_categories_au AFTER UPDATE OF categories_ia ON articles BEGIN
+    DELETE FROM article_categories WHERE article_id = old.id;
+    INSERT OR IGNORE INTO article_categories (article_id, category)
+    SELECT new.id, value FROM json_each(new.categories_ia)
+    WHERE json_valid(new.categories_ia) AND json_type(new.categories_ia) = 'array' AND type = 'text';
+END;
+INSERT OR IGNORE INTO article_categories (article_id, category)
+SELECT a.id, j.value FROM articles a, json_each(a.categories_ia) j
+WHERE json_valid(a.categories_ia) AND json_type(a.categories_ia) = 'array' AND j.type = 'text';
+{mark_schema_sql('article_categories')}COMMIT;
+'''
+
+# Index des requêtes du viewer (mêmes définitions que le schéma du SQLiteIntegrator):
+# SQLite n'a pas d'INCLUDE, les SELECT * restent des recherches par rowid mais sans parcours ni tri
+INDEX_SCHEMA = '''
+CREATE INDEX IF NOT EXISTS idx_articles_date_created ON articles(date_extraction, created_at);
+CREATE INDEX IF NOT EXISTS idx_articles_created ON articles(created_at);
+CREATE INDEX IF NOT EXISTS idx_syntheses_date_created ON syntheses(date_synthese, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_articles_nl_date ON articles(newsletter_type, date_extraction DESC);
+'''
+
+# Pré-agrégats des statistiques, vidés par triggers à chaque écriture dans articles
+STATS_CACHE_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS stats_cache (
+    key TEXT PRIMARY KEY,
+    value_json TEXT NOT NULL,
+    refreshed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+CREATE TRIGGER IF NOT EXISTS stats_cache_ai AFTER INSERT ON articles BEGIN
+    DELETE FROM stats_cache;
+END;
+CREATE TRIGGER IF NOT EXISTS stats_cache_ad AFTER DELETE ON articles BEGIN
+    DELETE FROM stats_cache;
+END;
+CREATE TRIGGER IF NOT EXISTS stats_cache_au AFTER UPDATE ON articles BEGIN
+    DELETE FROM stats_cache;
+END;
+'''
+
+SQL_TOTALS = '''
+    SELECT (SELECT COUNT(*) FROM articles),
+           (SELECT COUNT(*) FROM syntheses),
+           (SELECT COUNT(*) FROM rapports)
+'''
+# Articles par type et par date (30 derniers jours) en une requête, distingués par "kind"
+SQL_ARTICLE_AGGREGATES = '''
+    WITH by_type AS (
+        SELECT newsletter_type AS k, COUNT(*) AS n
+        FROM articles
+        GROUP BY newsletter_type
+    ), recent AS (
+        SELECT date_extraction AS k, COUNT(*) AS n
+        FROM articles
+        WHERE date_extraction >= date('now', '-30 days')
+        GROUP BY date_extraction
+    )
+    SELECT kind, k, n FROM (
+        SELECT 'type' AS kind, k, n FROM by_type
+        UNION ALL
+        SELECT 'date', k, n FROM recent
+    )
+    ORDER BY kind DESC,
+             CASE WHEN kind = 'type' THEN -n END,
+             CASE WHEN kind = 'type' THEN k END,
+             k DESC
+'''
+SQL_RECENT_SYNTHESES = "SELECT date_synthese, newsletter_type, nb_articles FROM syntheses ORDER BY created_at DESC LIMIT 10"
+# Repli sans table article_categories (base en lecture seule): JSON décodé en C par json_each
+SQL_TOP_CATEGORIES_JSON = '''
+    SELECT je.value, COUNT(*) AS c
+    FROM articles, json_each(articles.categories_ia) je
+    WHERE json_valid(articles.categories_ia) AND json_type(articles.categories_ia) = 'array'
+    GROUP BY je.value
+    ORDER BY c DESC
+    LIMIT 10
+'''
+SQL_TOP_CATEGORIES = '''
+    SELECT category, COUNT(*) AS c
+    FROM article_categories
+    GROUP BY category
+    ORDER BY c DESC
+    LIMIT 10
+'''
+
+# Requêtes de consultation: constantes réutilisées d'un appel à l'autre, donc préparées
+# une seule fois par connexion du pool (cache de requêtes de sqlite3)
+SQL_SEARCH_FTS = '''
+    WITH fts AS MATERIALIZED (
+        SELECT rowid, bm25(articles_fts) AS score
+        FROM articles_fts
+        WHERE articles_fts MATCH ?
+    )
+    SELECT a.* FROM fts
+    JOIN articles a ON a.id = fts.rowid
+    WHERE ? IS NULL OR a.newsletter_type = ?
+    ORDER BY fts.score
+    LIMIT ?
+'''
+SQL_SEARCH_LIKE = '''
+    SELECT * FROM articles 
+    WHERE (titre LIKE ? OR resume_tldr LIKE ?)
+      AND (? IS NULL OR newsletter_type = ?)
+    ORDER BY created_at DESC 
+    LIMIT ?
+'''
+SQL_ARTICLES_BY_DATE = "SELECT * FROM articles WHERE date_extraction = ? ORDER BY created_at"
+SQL_SYNTHESIS_BY_DATE = "SELECT * FROM syntheses WHERE date_synthese = ? ORDER BY created_at DESC LIMIT 1"
+
+def _stats_cache_key(name: str, sql: str) -> str:
+    """Clé de cache: nom + empreinte de la requête source (une requête modifiée repart à vide)"""
+    return f"{name}:{hashlib.sha1(sql.encode('utf-8')).hexdigest()[:12]}"
+
+STATS_CACHE_KEYS = {
+    'articles_by_type': _stats_cache_key('articles_by_type', SQL_ARTICLE_AGGREGATES),
+    'recent_articles': _stats_cache_key('recent_articles', SQL_ARTICLE_AGGREGATES),
+    'top_categories': _stats_cache_key('top_categories', SQL_TOP_CATEGORIES),
+}
+
 class TLDRSQLiteViewer:
     """Visualiseur et exporteur pour la base SQLite TLDR"""
     
@@ -25,62 +226,165 @@ class TLDRSQLiteViewer:
             raise FileNotFoundError(f"❌ Base de données non trouvée: {db_path}")
         
         logger.info(f"📊 Connexion à la base: {self.db_path}")
+        self.fts_enabled = self._ensure_fts()
+        self.categories_enabled = self._ensure_categories()
+        self.stats_cache_enabled = self._ensure_stats_cache()
+        self._ensure_indexes()
+        
+        # Pool de lecteurs: plus d'ouverture de la base (+ fichiers -wal/-shm) à chaque appel
+        self._read_uri = f"{self.db_path.resolve().as_uri()}?mode=ro"
+        self._read_pool = queue.Queue()
+        for _ in range(READ_POOL_SIZE):
+            self._read_pool.put(self._open_read_conn())
     
-    def get_statistics(self) -> Dict[str, Any]:
-        """Récupère les statistiques complètes de la base"""
+    def _open_read_conn(self) -> sqlite3.Connection:
+        """Ouvre une connexion en lecture seule configurée pour le mode WAL"""
+        conn = sqlite3.connect(self._read_uri, uri=True, check_same_thread=False, cached_statements=256)
+        for pragma in READ_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+    
+    @contextmanager
+    def _read_conn(self):
+        """Emprunte une connexion de lecture au pool et la rend après usage"""
+        conn = self._read_pool.get()
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            yield conn
+        finally:
+            self._read_pool.put(conn)
+    
+    def close(self):
+        """Ferme les connexions du pool"""
+        while True:
+            try:
+                self._read_pool.get_nowait().close()
+            except queue.Empty:
+                break
+    
+    def _ensure_fts(self) -> bool:
+        """Crée l'index plein texte des articles au premier lancement (migration unique)"""
+        try:
+            with sqlite3.connect(self.db_path, isolation_level=None) as conn:
                 cursor = conn.cursor()
+                cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'articles_fts'")
+                if cursor.fetchone():
+                    return True
+                
+                logger.info("🔧 Création de l'index plein texte des articles...")
+                cursor.executescript(FTS_SCHEMA)
+                return True
+                
+        except sqlite3.Error as e:
+            # SQLite compilé sans FTS5 ou base en lecture seule: recherche LIKE
+            logger.warning(f"⚠️ Index plein texte indisponible, recherche LIKE: {e}")
+            return False
+    
+    def _ensure_categories(self) -> bool:
+        """Crée la table des catégories normalisées et la remplit depuis le JSON existant (migration unique)"""
+        try:
+            with sqlite3.connect(self.db_path, isolation_level=None) as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'article_categories'")
+                if cursor.fetchone() and schema_is_current(conn, 'article_categories'):
+                    return True
+                
+                logger.info("🔧 Normalisation des catégories des articles...")
+                cursor.executescript(CATEGORIES_SCHEMA)
+                return True
+                
+        except sqlite3.Error as e:
+            # Base en lecture seule: les statistiques passent par json_each
+            logger.warning(f"⚠️ Table des catégories indisponible, agrégation via json_each: {e}")
+            return False
+    
+    def _ensure_stats_cache(self) -> bool:
+        """Crée la table des pré-agrégats et ses triggers d'invalidation"""
+        try:
+            with sqlite3.connect(self.db_path, isolation_level=None) as conn:
+                conn.executescript(STATS_CACHE_SCHEMA)
+                return True
                 
-                # Statistiques générales
-                cursor.execute("SELECT COUNT(*) FROM articles")
-                total_articles = cursor.fetchone()[0]
-                
-                cursor.execute("SELECT COUNT(*) FROM syntheses")
-                total_syntheses = cursor.fetchone()[0]
-                
-                cursor.execute("SELECT COUNT(*) FROM rapports")
-                total_rapports = cursor.fetchone()[0]
-                
-                # Articles par newsletter type
-                cursor.execute('''
-                    SELECT newsletter_type, COUNT(*) 
-                    FROM articles 
-                    GROUP BY newsletter_type
-                    ORDER BY COUNT(*) DESC
-                ''')
-                articles_by_type = dict(cursor.fetchall())
+        except sqlite3.Error as e:
+            logger.warning(f"⚠️ Cache des statistiques indisponible: {e}")
+            return False
+    
+    def _ensure_indexes(self):
+        """Crée les index utilisés par les requêtes du viewer s'ils manquent"""
+        try:
+            with sqlite3.connect(self.db_path, isolation_level=None) as conn:
+                conn.executescript(INDEX_SCHEMA)
                 
-                # Articles par date (derniers 30 jours)
-                cursor.execute('''
-                    SELECT date_extraction, COUNT(*) 
-                    FROM articles 
-                    WHERE date_extraction >= date('now', '-30 days')
-                    GROUP BY date_extraction 
-                    ORDER BY date_extraction DESC
-                ''')
-                recent_articles = dict(cursor.fetchall())
+        except sqlite3.Error as e:
+            logger.warning(f"⚠️ Index non créés, requêtes par parcours complet: {e}")
+    
+    def _load_cached_aggregates(self, cursor) -> Optional[Dict[str, Any]]:
+        """Lit les pré-agrégats s'ils sont complets et calculés aujourd'hui (fenêtre 30 jours)"""
+        cursor.execute("SELECT key, value_json FROM stats_cache WHERE date(refreshed_at) = date('now')")
+        cached = dict(cursor.fetchall())
+        if not all(key in cached for key in STATS_CACHE_KEYS.values()):
+            return None
+        return {name: dict(json.loads(cached[key])) for name, key in STATS_CACHE_KEYS.items()}
+    
+    def _compute_aggregates(self, cursor) -> Dict[str, Any]:
+        """Recalcule les agrégats coûteux (parcours complet des articles)"""
+        # Articles par newsletter type et par date (derniers 30 jours)
+        articles_by_type = {}
+        recent_articles = {}
+        cursor.execute(SQL_ARTICLE_AGGREGATES)
+        for kind, key, count in cursor:
+            if kind == 'type':
+                articles_by_type[key] = count
+            else:
+                recent_articles[key] = count
+        
+        # Catégories les plus fréquentes: agrégées par SQLite, sans json.loads par article
+        cursor.execute(SQL_TOP_CATEGORIES if self.categories_enabled else SQL_TOP_CATEGORIES_JSON)
+        top_categories = dict(cursor.fetchall())
+        
+        return {
+            'articles_by_type': articles_by_type,
+            'recent_articles': recent_articles,
+            'top_categories': top_categories
+        }
+    
+    def _store_aggregates(self, aggregates: Dict[str, Any]):
+        """Enregistre les pré-agrégats (les lecteurs du pool sont en lecture seule)"""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO stats_cache (key, value_json, refreshed_at) VALUES (?, ?, CURRENT_TIMESTAMP)",
+                    # Paires (clé, valeur) plutôt qu'un objet JSON: une clé None (newsletter_type NULL) reste None
+                    [(key, json.dumps(list(aggregates[name].items()), ensure_ascii=False)) for name, key in STATS_CACHE_KEYS.items()]
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"⚠️ Cache des statistiques non mis à jour: {e}")
+    
+    @staticmethod
+    def _fts_query(query: str) -> str:
+        """Transforme la saisie en requête FTS5: chaque mot entre guillemets (opérateurs
+        neutralisés) et en préfixe, tous les mots requis"""
+        terms = query.split()
+        return ' '.join('"' + term.replace('"', '""') + '"*' for term in terms)
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """Récupère les statistiques complètes de la base"""
+        try:
+            with self._read_conn() as conn:
+                cursor = conn.cursor()
                 
-                # Catégories les plus fréquentes
-                cursor.execute("SELECT categories_ia FROM articles WHERE categories_ia IS NOT NULL")
-                all_categories = []
-                for row in cursor.fetchall():
-                    try:
-                        cats = json.loads(row[0])
-                        all_categories.extend(cats)
-                    except:
-                        continue
+                # Statistiques générales (une seule requête pour les trois totaux)
+                cursor.execute(SQL_TOTALS)
+                total_articles, total_syntheses, total_rapports = cursor.fetchone()
                 
-                from collections import Counter
-                top_categories = dict(Counter(all_categories).most_common(10))
+                # Agrégats coûteux: pré-calculés, recalculés seulement après une écriture
+                aggregates = self._load_cached_aggregates(cursor) if self.stats_cache_enabled else None
+                if aggregates is None:
+                    aggregates = self._compute_aggregates(cursor)
+                    if self.stats_cache_enabled:
+                        self._store_aggregates(aggregates)
                 
                 # Synthèses récentes
-                cursor.execute('''
-                    SELECT date_synthese, newsletter_type, nb_articles 
-                    FROM syntheses 
-                    ORDER BY created_at DESC 
-                    LIMIT 10
-                ''')
+                cursor.execute(SQL_RECENT_SYNTHESES)
                 recent_syntheses = cursor.fetchall()
                 
                 # Taille de la base
@@ -90,9 +394,9 @@ class TLDRSQLiteViewer:
                     'total_articles': total_articles,
                     'total_syntheses': total_syntheses,
                     'total_rapports': total_rapports,
-                    'articles_by_type': articles_by_type,
-                    'recent_articles': recent_articles,
-                    'top_categories': top_categories,
+                    'articles_by_type': aggregates['articles_by_type'],
+                    'recent_articles': aggregates['recent_articles'],
+                    'top_categories': aggregates['top_categories'],
                     'recent_syntheses': recent_syntheses,
                     'db_size_mb': round(db_size_mb, 2),
                     'db_path': str(self.db_path)
@@ -102,31 +406,23 @@ class TLDRSQLiteViewer:
             logger.error(f"❌ Erreur récupération statistiques: {e}")
             return {}
     
-    def search_articles(self, query: str, limit: int = 20) -> List[Dict]:
-        """Recherche dans les articles"""
+    def search_articles(self, query: str, limit: int = 20, newsletter_type: Optional[str] = None) -> List[Dict]:
+        """Recherche dans les articles (optionnellement limitée à un type de newsletter)"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
+            with self._read_conn() as conn:
                 cursor = conn.cursor()
                 
-                cursor.execute('''
-                    SELECT * FROM articles 
-                    WHERE titre LIKE ? OR resume_tldr LIKE ? 
-                    ORDER BY created_at DESC 
-                    LIMIT ?
-                ''', (f'%{query}%', f'%{query}%', limit))
-                
-                results = []
-                for row in cursor.fetchall():
-                    result = dict(row)
-                    # Parser les catégories JSON
-                    try:
-                        result['categories_ia'] = json.loads(result['categories_ia']) if result['categories_ia'] else []
-                    except:
-                        result['categories_ia'] = []
-                    results.append(result)
-                
-                return results
+                fts_query = self._fts_query(query) if self.fts_enabled else ''
+                if fts_query:
+                    # Index inversé + classement par pertinence au lieu d'un parcours complet.
+                    # Le MATCH est matérialisé dans une CTE (toutes les correspondances, sans LIMIT)
+                    # pour que le filtre sur articles ne fasse pas abandonner l'index FTS au
+                    # planificateur; le filtre et la limite s'appliquent ensuite, sans perdre de résultats
+                    cursor.execute(SQL_SEARCH_FTS, (fts_query, newsletter_type, newsletter_type, limit))
+                else:
+                    cursor.execute(SQL_SEARCH_LIKE, (f'%{query}%', f'%{query}%', newsletter_type, newsletter_type, limit))
+                
+                return self._article_dicts(cursor)
                 
         except Exception as e:
             logger.error(f"❌ Erreur recherche: {e}")
@@ -135,26 +431,12 @@ class TLDRSQLiteViewer:
     def get_articles_by_date(self, date_str: str) -> List[Dict]:
         """Récupère tous les articles d'une date donnée"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
+            with self._read_conn() as conn:
                 cursor = conn.cursor()
                 
-                cursor.execute('''
-                    SELECT * FROM articles 
-                    WHERE date_extraction = ? 
-                    ORDER BY created_at
-                ''', (date_str,))
-                
-                results = []
-                for row in cursor.fetchall():
-                    result = dict(row)
-                    try:
-                        result['categories_ia'] = json.loads(result['categories_ia']) if result['categories_ia'] else []
-                    except:
-                        result['categories_ia'] = []
-                    results.append(result)
+                cursor.execute(SQL_ARTICLES_BY_DATE, (date_str,))
                 
-                return results
+                return self._article_dicts(cursor)
                 
         except Exception as e:
             logger.error(f"❌ Erreur récupération articles par date: {e}")
@@ -163,78 +445,112 @@ class TLDRSQLiteViewer:
     def get_synthesis_by_date(self, date_str: str) -> Dict:
         """Récupère la synthèse d'une date donnée"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
+            with self._read_conn() as conn:
                 cursor = conn.cursor()
                 
-                cursor.execute('''
-                    SELECT * FROM syntheses 
-                    WHERE date_synthese = ? 
-                    ORDER BY created_at DESC 
-                    LIMIT 1
-                ''', (date_str,))
+                cursor.execute(SQL_SYNTHESIS_BY_DATE, (date_str,))
                 
                 row = cursor.fetchone()
-                return dict(row) if row else {}
+                return dict(zip([column[0] for column in cursor.description], row)) if row else {}
                 
         except Exception as e:
             logger.error(f"❌ Erreur récupération synthèse: {e}")
             return {}
     
+    @staticmethod
+    def _article_dicts(cursor) -> List[Dict]:
+        """Convertit les tuples du curseur en dicts (noms de colonnes lus une seule fois)
+        et décode les catégories JSON et le contenu brut compressé"""
+        columns = [column[0] for column in cursor.description]
+        unpack = 'contenu_brut' in columns
+        results = []
+        for row in cursor:
+            result = dict(zip(columns, row))
+            if unpack:
+                result['contenu_brut'] = _unpack_contenu(result['contenu_brut'])
+            try:
+                result['categories_ia'] = json.loads(result['categories_ia']) if result['categories_ia'] else []
+            except:
+                result['categories_ia'] = []
+            results.append(result)
+        return results
+    
+    @staticmethod
+    def _json_object_sql(cursor, table: str, decoded_columns: tuple = (), packed_columns: tuple = ()) -> str:
+        """Expression json_object() couvrant toutes les colonnes de la table; les colonnes
+        JSON (decoded_columns) sont intégrées telles quelles, [] si vides ou invalides.
+        json_object() refuse les BLOB: ceux des packed_columns valent null (décompressés
+        ensuite en Python), les autres sont exportés en hexadécimal"""
+        cursor.execute(f"PRAGMA table_info({table})")
+        parts = []
+        for column in (row[1] for row in cursor.fetchall()):
+            quoted = '"' + column.replace('"', '""') + '"'
+            if column in decoded_columns:
+                quoted = f"CASE WHEN json_valid({quoted}) THEN json({quoted}) ELSE json_array() END"
+            elif column in packed_columns:
+                quoted = f"CASE WHEN typeof({quoted}) = 'blob' THEN NULL ELSE {quoted} END"
+            else:
+                quoted = f"CASE WHEN typeof({quoted}) = 'blob' THEN hex({quoted}) ELSE {quoted} END"
+            parts.append("'" + column.replace("'", "''") + "', " + quoted)
+        return f"json_object({', '.join(parts)})"
+    
+    def _write_json_rows(self, cursor, f, table: str, decoded_columns: tuple = (), packed_columns: tuple = ()) -> int:
+        """Écrit les lignes d'une table en tableau JSON, une ligne à la fois (formatées par SQLite;
+        seules les lignes au contenu compressé repassent par Python)"""
+        json_object = self._json_object_sql(cursor, table, decoded_columns, packed_columns)
+        raw_columns = ''.join(', "' + column.replace('"', '""') + '"' for column in packed_columns)
+        cursor.execute(f"SELECT {json_object}{raw_columns} FROM {table} ORDER BY created_at")
+        count = 0
+        f.write('[')
+        for row_json, *packed in cursor:
+            if any(isinstance(value, bytes) for value in packed):
+                row = json.loads(row_json)
+                for column, value in zip(packed_columns, packed):
+                    if isinstance(value, bytes):
+                        row[column] = _unpack_contenu(value)
+                row_json = json.dumps(row, ensure_ascii=False)
+            f.write(',\n    ' if count else '\n    ')
+            f.write(row_json)
+            count += 1
+        f.write('\n  ]' if count else ']')
+        return count
+    
     def export_to_json(self, output_file: str = None) -> str:
-        """Exporte toute la base en JSON"""
+        """Exporte toute la base en JSON (en flux: aucune table n'est chargée en mémoire).
+        Le fichier est écrit à côté puis renommé: un export interrompu ne laisse pas de JSON tronqué"""
         if not output_file:
             output_file = f"tldr_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
         
+        export_path = Path(output_file)
+        tmp_path = export_path.with_name(export_path.name + '.tmp')
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
+            statistics = self.get_statistics()
+            
+            with self._read_conn() as conn:
                 cursor = conn.cursor()
                 
-                # Récupérer toutes les données
-                cursor.execute("SELECT * FROM articles ORDER BY created_at")
-                articles = []
-                for row in cursor.fetchall():
-                    article = dict(row)
-                    try:
-                        article['categories_ia'] = json.loads(article['categories_ia']) if article['categories_ia'] else []
-                    except:
-                        article['categories_ia'] = []
-                    articles.append(article)
-                
-                cursor.execute("SELECT * FROM syntheses ORDER BY created_at")
-                syntheses = [dict(row) for row in cursor.fetchall()]
-                
-                cursor.execute("SELECT * FROM rapports ORDER BY created_at")
-                rapports = []
-                for row in cursor.fetchall():
-                    rapport = dict(row)
-                    try:
-                        rapport['erreurs'] = json.loads(rapport['erreurs']) if rapport['erreurs'] else []
-                    except:
-                        rapport['erreurs'] = []
-                    rapports.append(rapport)
-                
-                # Préparer l'export
-                export_data = {
-                    'export_date': datetime.now().isoformat(),
-                    'statistics': self.get_statistics(),
-                    'articles': articles,
-                    'syntheses': syntheses,
-                    'rapports': rapports
-                }
-                
-                # Sauvegarder
-                export_path = Path(output_file)
-                with open(export_path, 'w', encoding='utf-8') as f:
-                    json.dump(export_data, f, indent=2, ensure_ascii=False)
+                with open(tmp_path, 'w', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as f:
+                    f.write('{\n')
+                    f.write(f'  "export_date": {json.dumps(datetime.now().isoformat())},\n')
+                    statistics_json = json.dumps(statistics, indent=2, ensure_ascii=False).replace('\n', '\n  ')
+                    f.write(f'  "statistics": {statistics_json},\n')
+                    
+                    f.write('  "articles": ')
+                    nb_articles = self._write_json_rows(cursor, f, 'articles', ('categories_ia',), ('contenu_brut',))
+                    f.write(',\n  "syntheses": ')
+                    nb_syntheses = self._write_json_rows(cursor, f, 'syntheses')
+                    f.write(',\n  "rapports": ')
+                    nb_rapports = self._write_json_rows(cursor, f, 'rapports', ('erreurs',))
+                    f.write('\n}')
+                os.replace(tmp_path, export_path)
                 
                 logger.info(f"✅ Export JSON créé: {export_path}")
-                logger.info(f"📊 Contenu: {len(articles)} articles, {len(syntheses)} synthèses, {len(rapports)} rapports")
+                logger.info(f"📊 Contenu: {nb_articles} articles, {nb_syntheses} synthèses, {nb_rapports} rapports")
                 return str(export_path)
                 
         except Exception as e:
             logger.error(f"❌ Erreur export JSON: {e}")
+            tmp_path.unlink(missing_ok=True)
             return ""
     
     def export_articles_to_csv(self, output_file: str = None) -> str:
@@ -243,14 +559,23 @@ class TLDRSQLiteViewer:
             output_file = f"tldr_articles_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
         
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
+            with self._read_conn() as conn:
                 cursor = conn.cursor()
                 
-                cursor.execute("SELECT * FROM articles ORDER BY created_at")
+                # Colonnes dans l'ordre du CSV, catégories jointes par SQLite: les tuples
+                # du curseur partent directement dans writerows, sans objet intermédiaire
+                cursor.execute('''
+                    SELECT id, titre, url, resume_tldr, etat,
+                           CASE WHEN json_valid(categories_ia) AND json_type(categories_ia) = 'array'
+                                THEN COALESCE((SELECT group_concat(value, ', ') FROM json_each(categories_ia)), '')
+                                ELSE '' END,
+                           duree_lecture, date_extraction, source, newsletter_type, created_at
+                    FROM articles
+                    ORDER BY created_at
+                ''')
                 
                 export_path = Path(output_file)
-                with open(export_path, 'w', newline='', encoding='utf-8') as csvfile:
+                with open(export_path, 'w', newline='', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as csvfile:
                     writer = csv.writer(csvfile)
                     
                     # En-têtes
@@ -260,26 +585,7 @@ class TLDRSQLiteViewer:
                     ])
                     
                     # Données
-                    for row in cursor.fetchall():
-                        try:
-                            categories = json.loads(row['categories_ia']) if row['categories_ia'] else []
-                            categories_str = ', '.join(categories)
-                        except:
-                            categories_str = ''
-                        
-                        writer.writerow([
-                            row['id'],
-                            row['titre'],
-                            row['url'],
-                            row['resume_tldr'],
-                            row['etat'],
-                            categories_str,
-                            row['duree_lecture'],
-                            row['date_extraction'],
-                            row['source'],
-                            row['newsletter_type'],
-                            row['created_at']
-                        ])
+                    writer.writerows(cursor)
                 
                 logger.info(f"✅ Export CSV créé: {export_path}")
                 return str(export_path)
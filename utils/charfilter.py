@@ -0,0 +1,22 @@
+"""
+Filtrage de caractères via str.translate (équivalent de re.sub(r'[^\w\s...]', '', texte))
+"""
+
+
+class CharFilter(dict):
+    """Table pour str.translate qui supprime tout caractère hors \\w, \\s et `extra`
+
+    Chaque code est classé à sa première rencontre puis mémorisé: les appels
+    suivants restent entièrement dans la boucle C de str.translate.
+    """
+
+    def __init__(self, extra: str = ""):
+        super().__init__()
+        self.extra = frozenset(extra)
+
+    def __missing__(self, codepoint: int):
+        char = chr(codepoint)
+        keep = char.isalnum() or char == '_' or char.isspace() or char in self.extra
+        value = codepoint if keep else None
+        self[codepoint] = value
+        return value
@@ -0,0 +1,58 @@
+"""
+Versions du schéma SQLite partagées par les modules qui écrivent le DDL de la base
+(core/sqlite_integrator.py, core/sqliteintegrator.py, sqlite_viewer.py)
+
+Chaque partie du schéma a sa propre ligne dans la table schema_versions, au lieu
+de se disputer l'unique entier PRAGMA user_version.
+"""
+
+import sqlite3
+
+# Version courante de chaque partie du schéma: à incrémenter à chaque modification du DDL concerné
+SCHEMA_VERSIONS = {
+    'sqlite_integrator': 2,   # tables, FTS5 et compteurs de core/sqlite_integrator.py
+    'article_categories': 1,  # catégories normalisées (table, triggers, remplissage initial)
+}
+
+SCHEMA_VERSIONS_DDL = (
+    "CREATE TABLE IF NOT EXISTS schema_versions ("
+    "component TEXT PRIMARY KEY, version INTEGER NOT NULL)"
+)
+
+
+def schema_version(conn: sqlite3.Connection, component: str) -> int:
+    """Version enregistrée pour une partie du schéma (0 si elle n'a jamais été migrée)"""
+    has_table = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'schema_versions'"
+    ).fetchone()
+    if not has_table:
+        return 0
+    row = conn.execute(
+        "SELECT version FROM schema_versions WHERE component = ?", (component,)
+    ).fetchone()
+    return row[0] if row else 0
+
+
+def schema_is_current(conn: sqlite3.Connection, component: str) -> bool:
+    """True si le DDL de cette partie du schéma est déjà à jour"""
+    return schema_version(conn, component) >= SCHEMA_VERSIONS[component]
+
+
+def mark_schema_sql(component: str) -> str:
+    """Instructions qui enregistrent la version courante d'une partie du schéma,
+    à placer dans la même transaction que son DDL (rien n'est marqué s'il échoue)"""
+    return (
+        f"{SCHEMA_VERSIONS_DDL};\n"
+        f"INSERT OR REPLACE INTO schema_versions (component, version) "
+        f"VALUES ('{component}', {SCHEMA_VERSIONS[component]});\n"
+    )
+
+
+def mark_schema_current(conn: sqlite3.Connection, component: str):
+    """Enregistre la version courante d'une partie du schéma dans la transaction en cours
+    (executescript validerait la transaction: instructions exécutées une à une)"""
+    conn.execute(SCHEMA_VERSIONS_DDL)
+    conn.execute(
+        "INSERT OR REPLACE INTO schema_versions (component, version) VALUES (?, ?)",
+        (component, SCHEMA_VERSIONS[component]),
+    )
@@ -1,4 +1,5 @@
 import requests
+from bisect import bisect_right
 from datetime import datetime, date, timedelta
 from typing import List, Dict, Any, Optional
 import logging
@@ -15,6 +16,8 @@ class SmartDateHandler:
         self.max_days_back = max_days_back
         self.holidays_cache = {}
         self.base_url = "https://date.nager.at/api/v3"
+        # Jours ouvrables triés, par année (construits à la demande)
+        self._sorted_business_days: Dict[int, List[date]] = {}
         
     def get_holidays_for_year(self, year: int) -> List[str]:
         """Récupère les jours fériés pour une année donnée"""
@@ -67,6 +70,19 @@ class SmartDateHandler:
         """Vérifie si une date est un jour ouvrable"""
         return not (self.is_weekend(target_date) or self.is_holiday(target_date))
     
+    def _business_days_for_year(self, year: int) -> List[date]:
+        """Liste triée des jours ouvrables d'une année"""
+        if year not in self._sorted_business_days:
+            holidays = {date.fromisoformat(day) for day in self.get_holidays_for_year(year)}
+            days = []
+            current_date = date(year, 1, 1)
+            while current_date.year == year:
+                if current_date.weekday() < 5 and current_date not in holidays:
+                    days.append(current_date)
+                current_date += timedelta(days=1)
+            self._sorted_business_days[year] = days
+        return self._sorted_business_days[year]
+
     def get_last_business_day(self, from_date: date = None) -> date:
         """Trouve le dernier jour ouvrable avant une date donnée"""
         if from_date is None:
@@ -76,33 +92,24 @@ class SmartDateHandler:
         if from_date == date.today() and datetime.now().hour < 12:
             from_date = from_date - timedelta(days=1)
         
-        current_date = from_date
-        days_checked = 0
-        
         logger.info(f"🔍 Recherche du dernier jour ouvrable avant {from_date}")
         
-        while days_checked < self.max_days_back:
-            if self.is_business_day(current_date):
-                reason = "jour ouvrable trouvé"
-                if self.is_weekend(current_date):
-                    reason += " (weekend évité)"
-                if self.is_holiday(current_date):
-                    reason += " (jour férié évité)"
-                
-                logger.info(f"✅ Date retenue: {current_date} ({reason})")
-                return current_date
-            
-            # Log pourquoi cette date est évitée
-            skip_reason = []
-            if self.is_weekend(current_date):
-                skip_reason.append("weekend")
-            if self.is_holiday(current_date):
-                skip_reason.append("jour férié")
-            
-            logger.info(f"⏭️ {current_date} ignoré: {', '.join(skip_reason)}")
-            
-            current_date -= timedelta(days=1)
-            days_checked += 1
+        # Recherche dichotomique dans le calendrier de l'année (puis de l'année précédente)
+        oldest_date = from_date - timedelta(days=self.max_days_back - 1)
+        days = self._business_days_for_year(from_date.year)
+        index = bisect_right(days, from_date)
+        candidate = days[index - 1] if index else None
+        if candidate is None and oldest_date.year < from_date.year:
+            previous_days = self._business_days_for_year(from_date.year - 1)
+            candidate = previous_days[-1] if previous_days else None
+        
+        if candidate is not None and candidate >= oldest_date:
+            skipped = (from_date - candidate).days
+            reason = "jour ouvrable trouvé"
+            if skipped:
+                reason += f", {skipped} jour(s) ignoré(s): weekend/jour férié"
+            logger.info(f"✅ Date retenue: {candidate} ({reason})")
+            return candidate
         
         # Fallback : retourner la date originale si aucun jour ouvrable trouvé
         logger.warning(f"⚠️ Aucun jour ouvrable trouvé, utilisation de {from_date}")